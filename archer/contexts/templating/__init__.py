@@ -17,6 +17,7 @@ from archer.contexts.templating.converter import (
     ConversionResult,
     generate_resume,
     parse_resume,
+    validate_roundtrip_batch,
     validate_roundtrip_conversion,
 )
 from archer.contexts.templating.latex_normalizer import (
@@ -35,6 +36,7 @@ __all__ = [
     "clean_yaml",
     "normalize_yaml",
     "validate_roundtrip_conversion",
+    "validate_roundtrip_batch",
     "parse_resume",
     "generate_resume",
     "ConversionResult",
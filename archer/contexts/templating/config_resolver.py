@@ -17,7 +17,8 @@ from pathlib import Path
 from typing import Any, Dict, List
 
 from dotenv import load_dotenv
-from omegaconf import OmegaConf
+
+from archer.utils.yaml_io import load_yaml
 
 load_dotenv()
 RESUME_PRESETS_PATH = Path(os.getenv("RESUME_PRESETS_PATH"))
@@ -39,7 +40,7 @@ def load_resume_presets(config_path: Path = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = RESUME_PRESETS_PATH
 
-    nested = OmegaConf.to_container(OmegaConf.load(config_path), resolve=True)
+    nested = load_yaml(config_path)
 
     # Flatten: category.name -> category_name
     flattened = {}
@@ -5,29 +5,33 @@ Main module providing convenience functions for bidirectional conversion
 between structured YAML and LaTeX resume format.
 
 This module exports:
-- Convenience functions: yaml_to_latex, latex_to_yaml
+- Convenience functions: yaml_to_latex, latex_to_yaml, yaml_to_latex_batch
 - Orchestration functions: parse_resume, generate_resume (with registry tracking)
 - Converter classes: YAMLToLaTeXConverter, LaTeXToYAMLConverter (re-exported)
 """
 
+import errno
 import os
-import re
 import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from jinja2.exceptions import UndefinedError as JinjaUndefinedError
-from omegaconf import OmegaConf
 
 from archer.contexts.templating.exceptions import InvalidYAMLStructureError
 from archer.contexts.templating.latex_generator import YAMLToLaTeXConverter
 from archer.contexts.templating.latex_normalizer import process_file
 from archer.contexts.templating.latex_parser import LaTeXToYAMLConverter
-from archer.contexts.templating.latex_patterns import DocumentRegex, EnvironmentPatterns
+from archer.contexts.templating.latex_patterns import (
+    DocumentRegex,
+    EnvironmentPatterns,
+    regex_to_literal,
+)
 from archer.contexts.templating.logger import (
     _log_debug,
     log_conversion_result,
@@ -43,10 +47,15 @@ from archer.utils.resume_registry import (
 )
 from archer.utils.text_processing import get_meaningful_diff
 from archer.utils.timestamp import now
+from archer.utils.yaml_io import dump_yaml, load_yaml_cached
 
 load_dotenv()
 LOGS_PATH = Path(os.getenv("LOGS_PATH", "outs/logs"))
 
+# Fixed-string markers for latex_to_yaml dispatch: substring tests instead of regex searches
+BEGIN_DOCUMENT_LITERAL = regex_to_literal(DocumentRegex.BEGIN_DOCUMENT)
+END_DOCUMENT_LITERAL = regex_to_literal(DocumentRegex.END_DOCUMENT)
+BEGIN_ITEMIZE_ACADEMIC_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC)
 
 # Result dataclasses for orchestration functions
 
@@ -93,8 +102,7 @@ def yaml_to_latex(yaml_path: Path, output_path: Path = None) -> str:
     Raises:
         ValueError: If YAML contains only plaintext fields without LaTeX-formatted equivalents
     """
-    yaml_data = OmegaConf.load(yaml_path)
-    yaml_dict = OmegaConf.to_container(yaml_data, resolve=True)
+    yaml_dict = load_yaml_cached(yaml_path)
 
     converter = YAMLToLaTeXConverter()
 
@@ -119,6 +127,44 @@ def yaml_to_latex(yaml_path: Path, output_path: Path = None) -> str:
     return latex
 
 
+def yaml_to_latex_batch(
+    conversions: List[Tuple[Path, Optional[Path]]], workers: Optional[int] = 1
+) -> List[str]:
+    """
+    Convert many YAML resumes to LaTeX, optionally in parallel.
+
+    Files are converted one at a time in-process by default. Since each
+    conversion is independent CPU-bound work, workers > 1 (or None for the CPU
+    count) fans them out to a process pool instead. Every worker builds its own
+    YAMLToLaTeXConverter inside yaml_to_latex(), so nothing unpicklable crosses
+    process boundaries.
+
+    Args:
+        conversions: (yaml_path, output_path) pairs; output_path may be None
+        workers: Number of worker processes (default: 1, in-process; None: CPU count)
+
+    Returns:
+        Generated LaTeX strings, in input order
+
+    Raises:
+        InvalidYAMLStructureError: If any YAML is missing required structural fields
+    """
+    if not conversions:
+        return []
+
+    yaml_paths, output_paths = zip(*conversions)
+
+    if workers == 1:
+        return list(map(yaml_to_latex, yaml_paths, output_paths))
+
+    # A few chunks per worker keeps pickling overhead low while balancing load
+    num_workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(conversions) // (num_workers * 4))
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        return list(executor.map(yaml_to_latex, yaml_paths, output_paths, chunksize=chunksize))
+
+
 def latex_to_yaml(latex_path: Path, output_path: Path = None) -> Dict[str, Any]:
     """
     Convert LaTeX resume to YAML structure.
@@ -134,13 +180,13 @@ def latex_to_yaml(latex_path: Path, output_path: Path = None) -> Dict[str, Any]:
 
     converter = LaTeXToYAMLConverter()
 
-    # Try to parse as full document first
-    if re.search(DocumentRegex.BEGIN_DOCUMENT, latex_str) and re.search(
-        DocumentRegex.END_DOCUMENT, latex_str
-    ):
+    # Try to parse as full document first; \end{document} is only searched for
+    # after \begin{document}, so the dispatch scans the string once
+    begin_doc_pos = latex_str.find(BEGIN_DOCUMENT_LITERAL)
+    if begin_doc_pos != -1 and latex_str.find(END_DOCUMENT_LITERAL, begin_doc_pos) != -1:
         # Full document
         yaml_dict = converter.parse_document(latex_str)
-    elif re.search(EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC, latex_str):
+    elif BEGIN_ITEMIZE_ACADEMIC_LITERAL in latex_str:
         # Single work experience subsection (for testing)
         result = converter.parse_work_experience(latex_str)
         yaml_dict = {"subsection": result}
@@ -150,12 +196,8 @@ def latex_to_yaml(latex_path: Path, output_path: Path = None) -> Dict[str, Any]:
         )
 
     if output_path:
-        conf = OmegaConf.create(yaml_dict)
-        OmegaConf.save(conf, output_path)
-
-        # Strip trailing blank lines for consistency
-        content = output_path.read_text()
-        output_path.write_text(content.rstrip() + "\n")
+        # Strip trailing blank lines for consistency, then write once
+        output_path.write_text(dump_yaml(yaml_dict).rstrip() + "\n", encoding="utf-8")
 
     return yaml_dict
 
@@ -174,12 +216,17 @@ def compare_yaml_structured(yaml1_path: Path, yaml2_path: Path) -> tuple[list[st
     Returns:
         Tuple of (diff_lines, num_differences)
     """
-    yaml1 = OmegaConf.load(yaml1_path)
-    yaml2 = OmegaConf.load(yaml2_path)
+    # Byte-identical files (a converged roundtrip) cannot differ once cleaned.
+    # Compare sizes first so differing files are not read here as well as by the loads.
+    if (
+        yaml1_path.stat().st_size == yaml2_path.stat().st_size
+        and yaml1_path.read_bytes() == yaml2_path.read_bytes()
+    ):
+        return [], 0
 
     # Clean both: add missing field pairs, sort keys (no defaults)
-    dict1 = clean_yaml(OmegaConf.to_container(yaml1))
-    dict2 = clean_yaml(OmegaConf.to_container(yaml2))
+    dict1 = clean_yaml(load_yaml_cached(yaml1_path))
+    dict2 = clean_yaml(load_yaml_cached(yaml2_path))
 
     if dict1 == dict2:
         return [], 0
@@ -195,7 +242,11 @@ def compare_yaml_structured(yaml1_path: Path, yaml2_path: Path) -> tuple[list[st
 
 
 def validate_roundtrip_conversion(
-    input_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int
+    input_file: Path,
+    work_dir: Path,
+    max_latex_diffs: int,
+    max_yaml_diffs: int,
+    fail_fast: bool = False,
 ) -> Dict:
     """
     Validate roundtrip conversion fidelity (routing function).
@@ -209,6 +260,9 @@ def validate_roundtrip_conversion(
         work_dir: Directory for intermediate files
         max_latex_diffs: Maximum allowed LaTeX differences
         max_yaml_diffs: Maximum allowed YAML differences
+        fail_fast: Stop after the first roundtrip comparison if it exceeds its
+            threshold; the second roundtrip is then reported as
+            {"success": None, "num_diffs": None, "skipped": True}
 
     Returns:
         Dict with validation results (same structure for both directions)
@@ -216,9 +270,13 @@ def validate_roundtrip_conversion(
     suffix = input_file.suffix.lower()
 
     if suffix == ".tex":
-        return _validate_roundtrip_from_tex(input_file, work_dir, max_latex_diffs, max_yaml_diffs)
+        return _validate_roundtrip_from_tex(
+            input_file, work_dir, max_latex_diffs, max_yaml_diffs, fail_fast
+        )
     elif suffix == ".yaml":
-        return _validate_roundtrip_from_yaml(input_file, work_dir, max_latex_diffs, max_yaml_diffs)
+        return _validate_roundtrip_from_yaml(
+            input_file, work_dir, max_latex_diffs, max_yaml_diffs, fail_fast
+        )
     else:
         return {
             "file": input_file.name,
@@ -230,8 +288,66 @@ def validate_roundtrip_conversion(
         }
 
 
+def _validate_roundtrip_in_subdir(
+    input_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int, fail_fast: bool
+) -> Dict:
+    """Validate one file using its own work_dir/<stem> subdirectory (picklable for workers)."""
+    return validate_roundtrip_conversion(
+        input_file, work_dir / input_file.stem, max_latex_diffs, max_yaml_diffs, fail_fast
+    )
+
+
+def validate_roundtrip_batch(
+    input_files: Iterable[Path],
+    work_dir: Path,
+    max_latex_diffs: int,
+    max_yaml_diffs: int,
+    workers: Optional[int] = 1,
+    fail_fast: bool = False,
+) -> Iterator[Dict]:
+    """
+    Validate roundtrip conversion for many files, optionally in parallel.
+
+    Files are validated one at a time in-process by default. Since each file is
+    independent, workers > 1 (or None for the CPU count) fans them out to a
+    process pool instead. Each file gets its own work_dir/<stem> subdirectory to
+    keep artifacts and diff files from colliding.
+
+    Args:
+        input_files: Paths to input files (.tex or .yaml)
+        work_dir: Parent directory for per-file intermediate files
+        max_latex_diffs: Maximum allowed LaTeX differences
+        max_yaml_diffs: Maximum allowed YAML differences
+        workers: Number of worker processes (default: 1, in-process; None: CPU count)
+        fail_fast: Skip a file's second roundtrip once the first has failed
+
+    Yields:
+        Validation result dicts (see validate_roundtrip_conversion), in input order.
+        In-process validation is lazy: each file is validated when its result is requested.
+    """
+    validate = partial(
+        _validate_roundtrip_in_subdir,
+        work_dir=work_dir,
+        max_latex_diffs=max_latex_diffs,
+        max_yaml_diffs=max_yaml_diffs,
+        fail_fast=fail_fast,
+    )
+
+    if workers == 1:
+        yield from map(validate, input_files)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        yield from executor.map(validate, input_files)
+    finally:
+        # If the caller stops early (break, Ctrl-C), drop queued files instead of
+        # blocking until every submitted validation has finished
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _validate_roundtrip_from_tex(
-    tex_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int
+    tex_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int, fail_fast: bool
 ) -> Dict:
     """
     Validate LaTeX → YAML → LaTeX roundtrip conversion.
@@ -247,8 +363,10 @@ def _validate_roundtrip_from_tex(
     5. Compare LaTeX (input vs generated)
     6. Re-parse generated LaTeX → YAML
     7. Compare YAML (parsed vs re-parsed)
+
+    With fail_fast, steps 6-7 are skipped when step 5 exceeds max_latex_diffs.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     result = {
         "file": tex_file.name,
         "latex_roundtrip": {"success": False, "num_diffs": None},
@@ -308,6 +426,11 @@ def _validate_roundtrip_from_tex(
             "num_diffs": latex_num_diffs,
         }
 
+        # Validation has already failed; mark the YAML roundtrip as not run
+        if fail_fast and not result["latex_roundtrip"]["success"]:
+            result["yaml_roundtrip"] = {"success": None, "num_diffs": None, "skipped": True}
+            return result
+
         # Step 6: Re-parse generated LaTeX for YAML roundtrip
         reparsed_yaml = work_dir / f"{file_stem}_reparsed.yaml"
         try:
@@ -337,14 +460,13 @@ def _validate_roundtrip_from_tex(
         result["error"] = f"Unexpected error: {str(e)}"
 
     finally:
-        end_time = datetime.now()
-        result["time_ms"] = (end_time - start_time).total_seconds() * 1000
+        result["time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
 
     return result
 
 
 def _validate_roundtrip_from_yaml(
-    yaml_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int
+    yaml_file: Path, work_dir: Path, max_latex_diffs: int, max_yaml_diffs: int, fail_fast: bool
 ) -> Dict:
     """
     Validate YAML → LaTeX → YAML roundtrip conversion.
@@ -360,8 +482,10 @@ def _validate_roundtrip_from_yaml(
     5. Re-generate re-parsed YAML → LaTeX
     6. Normalize re-generated LaTeX
     7. Compare LaTeX (generated vs re-generated)
+
+    With fail_fast, steps 5-7 are skipped when step 4 exceeds max_yaml_diffs.
     """
-    start_time = datetime.now()
+    start_ns = time.perf_counter_ns()
     result = {
         "file": yaml_file.name,
         "yaml_roundtrip": {"success": False, "num_diffs": None},
@@ -412,6 +536,11 @@ def _validate_roundtrip_from_yaml(
             "num_diffs": yaml_num_diffs,
         }
 
+        # Validation has already failed; mark the LaTeX roundtrip as not run
+        if fail_fast and not result["yaml_roundtrip"]["success"]:
+            result["latex_roundtrip"] = {"success": None, "num_diffs": None, "skipped": True}
+            return result
+
         # Step 5: Re-generate re-parsed YAML → LaTeX
         regenerated_tex = work_dir / f"{file_stem}_regenerated.tex"
         try:
@@ -456,8 +585,7 @@ def _validate_roundtrip_from_yaml(
         result["error"] = f"Unexpected error: {str(e)}"
 
     finally:
-        end_time = datetime.now()
-        result["time_ms"] = (end_time - start_time).total_seconds() * 1000
+        result["time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
 
     return result
 
@@ -590,7 +718,7 @@ def _run_conversion(
     Returns:
         ConversionResult with success status, paths, validation info, and timing
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Setup logging
     log_dir = LOGS_PATH / f"{config.phase_name}_{now()}"
@@ -614,7 +742,7 @@ def _run_conversion(
             input_path, log_dir, max_latex_diffs, max_yaml_diffs
         )
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         # Create base result with known values
         result = ConversionResult(
@@ -627,7 +755,7 @@ def _run_conversion(
             latex_diffs=roundtrip_validation_result["latex_roundtrip"]["num_diffs"],
         )
     except Exception as e:
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         result = ConversionResult(
             success=False,
             error=str(e),
@@ -638,8 +766,14 @@ def _run_conversion(
 
     # Handle success vs failure
     if result.success:
-        # Copy output to final location
-        shutil.copy(log_dir / output_filename, final_output_path)
+        # Move output to final location (the artifact cleanup below would delete it anyway)
+        try:
+            os.replace(log_dir / output_filename, final_output_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # LOGS_PATH and output_dir are on different filesystems
+            shutil.copy(log_dir / output_filename, final_output_path)
 
         # Clean up intermediate validation artifacts but keep log
         for file in log_dir.iterdir():
@@ -4,12 +4,13 @@ LaTeX Generator
 Converts structured YAML to LaTeX format.
 """
 
+import io
 import os
 from pathlib import Path
 from typing import Any, Dict
 
 from dotenv import load_dotenv
-from omegaconf import OmegaConf
+from jinja2 import Template
 
 from archer.contexts.templating.latex_patterns import (
     ContactFieldPatterns,
@@ -17,14 +18,27 @@ from archer.contexts.templating.latex_patterns import (
     PageRegex,
     regex_to_literal,
 )
-from archer.contexts.templating.registries import ParseConfigRegistry, TemplateRegistry
+from archer.contexts.templating.registries import (
+    ParseConfigRegistry,
+    TemplateRegistry,
+    get_default_parse_config_registry,
+    get_default_template_registry,
+)
 from archer.utils.latex_parsing_tools import format_latex_environment
 from archer.utils.text_processing import prepend_without_overlap, set_max_consecutive_blank_lines
+from archer.utils.yaml_io import load_yaml
 
 load_dotenv()
 TEMPLATING_CONTEXT_PATH = Path(os.getenv("TEMPLATING_CONTEXT_PATH"))
 USER_PROFILE_PATH = Path(os.getenv("USER_PROFILE_PATH"))
 
+# Fixed environment delimiters written for every page/section
+BEGIN_PARACOL_LITERAL = regex_to_literal(PageRegex.BEGIN_PARACOL)
+SWITCHCOLUMN_LITERAL = regex_to_literal(PageRegex.SWITCHCOLUMN)
+END_PARACOL_LITERAL = regex_to_literal(PageRegex.END_PARACOL)
+BEGIN_ITEMIZE_PROJ_MAIN_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_PROJ_MAIN)
+END_ITEMIZE_PROJ_MAIN_LITERAL = regex_to_literal(EnvironmentPatterns.END_ITEMIZE_PROJ_MAIN)
+
 
 class YAMLToLaTeXConverter:
     """Converts structured YAML to LaTeX format."""
@@ -35,11 +49,34 @@ class YAMLToLaTeXConverter:
         parse_config_registry: ParseConfigRegistry = None,
         profile_path: Path = USER_PROFILE_PATH,
     ):
-        self.template_registry = template_registry or TemplateRegistry()
-        self.parse_config_registry = parse_config_registry or ParseConfigRegistry()
+        self.template_registry = template_registry or get_default_template_registry()
+        self.parse_config_registry = parse_config_registry or get_default_parse_config_registry()
 
         # Load user profile for contact info
-        self.user_profile = OmegaConf.load(profile_path)
+        self.user_profile = load_yaml(profile_path)
+
+        # Compiled structure/wrapper templates, keyed by path relative to the templating context
+        self._structure_templates: Dict[str, Template] = {}
+
+    def _get_structure_template(self, relative_path: str) -> Template:
+        """
+        Load and compile a structure or wrapper template once per converter.
+
+        Section and contact-row wrappers are rendered once per section/row, so
+        reading and compiling them on every call dominated generation time.
+
+        Args:
+            relative_path: Template path relative to TEMPLATING_CONTEXT_PATH
+
+        Returns:
+            Compiled Jinja2 template
+        """
+        template = self._structure_templates.get(relative_path)
+        if template is None:
+            template_content = (TEMPLATING_CONTEXT_PATH / relative_path).read_text(encoding="utf-8")
+            template = self.template_registry.env.from_string(template_content)
+            self._structure_templates[relative_path] = template
+        return template
 
     def _generate_contact_info(self, metadata: Dict[str, Any]) -> str:
         """
@@ -52,8 +89,8 @@ class YAMLToLaTeXConverter:
             LaTeX string with table rows for contact info
         """
         # Start with defaults from user profile
-        contact_selection = list(self.user_profile.contact_selection)
-        contact_registry = dict(self.user_profile.contact_registry)
+        contact_selection = list(self.user_profile["contact_selection"])
+        contact_registry = dict(self.user_profile["contact_registry"])
 
         # Apply custom overrides from resume metadata if present
         custom = metadata.get("custom_contact_info", None)
@@ -64,9 +101,7 @@ class YAMLToLaTeXConverter:
                 contact_registry.update(custom["registry"])
 
         # Load contact row template
-        template_path = TEMPLATING_CONTEXT_PATH / "template/structure/contact_row.tex.jinja"
-        template_content = template_path.read_text(encoding="utf-8")
-        template = self.template_registry.env.from_string(template_content)
+        template = self._get_structure_template("template/structure/contact_row.tex.jinja")
 
         rows = []
         for field in contact_selection:
@@ -107,9 +142,7 @@ class YAMLToLaTeXConverter:
         contact_info = self._generate_contact_info(metadata)
 
         # Load preamble template directly (at root of templating directory)
-        preamble_path = TEMPLATING_CONTEXT_PATH / "template/structure/preamble.tex.jinja"
-        preamble_content = preamble_path.read_text(encoding="utf-8")
-        template = self.template_registry.env.from_string(preamble_content)
+        template = self._get_structure_template("template/structure/preamble.tex.jinja")
         return template.render(metadata=metadata, contact_info_rows=contact_info)
 
     def generate_document(self, doc: Dict[str, Any]) -> str:
@@ -177,9 +210,7 @@ class YAMLToLaTeXConverter:
             pages_with_rendered_sections.append(rendered_page)
 
         # Load and render document template
-        document_template_path = TEMPLATING_CONTEXT_PATH / "template/structure/document.tex.jinja"
-        document_template_content = document_template_path.read_text(encoding="utf-8")
-        document_template = self.template_registry.env.from_string(document_template_content)
+        document_template = self._get_structure_template("template/structure/document.tex.jinja")
 
         generated_latex = document_template.render(
             preamble=preamble, pages=pages_with_rendered_sections
@@ -200,8 +231,7 @@ class YAMLToLaTeXConverter:
             LaTeX string for itemizeAcademic environment
         """
         # Get environment name from parse config
-        config = self.parse_config_registry.get_config("work_experience")
-        latex_environment = config["operations"]["environment"]["env_name"]
+        latex_environment = self.parse_config_registry.get_environment_name("work_experience")
 
         metadata = subsection["metadata"]
         content = subsection["content"]
@@ -402,11 +432,12 @@ class YAMLToLaTeXConverter:
         Returns:
             LaTeX string for complete page
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
 
         # Start paracol
-        lines.append(regex_to_literal(PageRegex.BEGIN_PARACOL))
-        lines.append("")
+        write(BEGIN_PARACOL_LITERAL)
+        write("\n\n")
 
         # Generate page decorations (which have absolute positioning)
         # Render textblock + grad/bar commands at top of page
@@ -414,33 +445,32 @@ class YAMLToLaTeXConverter:
             for decoration in page_data["decorations"]:
                 decoration_latex = self._generate_decoration(decoration, page_data.get("bottom"))
                 if decoration_latex:
-                    lines.append(decoration_latex)
-            lines.append("")
+                    write(decoration_latex)
+                    write("\n")
+            write("\n")
 
         # Generate left column
         if page_data.get("left_column"):
             left_column = page_data["left_column"]
             for section_data in left_column.get("sections", []):
-                section_latex = self._generate_section(section_data)
-                lines.append(section_latex)
-                lines.append("")
+                write(self._generate_section(section_data))
+                write("\n\n")
 
         # Switch to main column
-        lines.append(regex_to_literal(PageRegex.SWITCHCOLUMN))
-        lines.append("")
+        write(SWITCHCOLUMN_LITERAL)
+        write("\n\n")
 
         # Generate main column
         if page_data.get("main_column"):
             main_column = page_data["main_column"]
             for section_data in main_column.get("sections", []):
-                section_latex = self._generate_section(section_data)
-                lines.append(section_latex)
-                lines.append("")
+                write(self._generate_section(section_data))
+                write("\n\n")
 
         # End paracol
-        lines.append(regex_to_literal(PageRegex.END_PARACOL))
+        write(END_PARACOL_LITERAL)
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def _generate_section(self, section_data: Dict[str, Any]) -> str:
         """
@@ -476,30 +506,30 @@ class YAMLToLaTeXConverter:
 
         elif section_type == "work_history":
             # Generate all work experience subsections
-            subsections = []
-            for subsection in section_data.get("subsections", []):
-                subsection_latex = self.convert_work_experience(subsection)
-                subsections.append(subsection_latex)
+            subsections = [
+                self.convert_work_experience(subsection)
+                for subsection in section_data.get("subsections", [])
+            ]
 
             # Wrap in outer itemize environment
-            wrapper_path = (
-                TEMPLATING_CONTEXT_PATH / "template/wrappers/work_history_wrapper.tex.jinja"
+            wrapper_template = self._get_structure_template(
+                "template/wrappers/work_history_wrapper.tex.jinja"
             )
-            wrapper_content = wrapper_path.read_text(encoding="utf-8")
-            wrapper_template = self.template_registry.env.from_string(wrapper_content)
             content_latex = wrapper_template.render(content="\n\n".join(subsections))
 
         elif section_type == "projects":
             # Standalone projects section (wrapped in itemizeProjMain)
-            projects = []
-            for project in section_data.get("subsections", []):
-                project_latex = self.convert_project(project, indent="    ")
-                projects.append(project_latex)
+            projects_latex = "\n\n".join(
+                self.convert_project(project, indent="    ")
+                for project in section_data.get("subsections", [])
+            )
 
-            # Wrap in itemizeProjMain environment
-            content_latex = f"{regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_PROJ_MAIN)}\n\n"
-            content_latex += "\n\n".join(projects)
-            content_latex += f"\n\n{regex_to_literal(EnvironmentPatterns.END_ITEMIZE_PROJ_MAIN)}"
+            # Wrap in itemizeProjMain environment (one string build instead of repeated +=)
+            content_latex = (
+                f"{BEGIN_ITEMIZE_PROJ_MAIN_LITERAL}\n\n"
+                f"{projects_latex}\n\n"
+                f"{END_ITEMIZE_PROJ_MAIN_LITERAL}"
+            )
 
         elif section_type == "custom_itemize":
             # Vanilla itemize with optional params and custom markers
@@ -519,11 +549,9 @@ class YAMLToLaTeXConverter:
                 content_latex = f"% Unknown section type: {section_type}"
 
         # Wrap with section header and spacing using template
-        section_wrapper_path = (
-            TEMPLATING_CONTEXT_PATH / "template/wrappers/section_wrapper.tex.jinja"
+        wrapper_template = self._get_structure_template(
+            "template/wrappers/section_wrapper.tex.jinja"
         )
-        section_wrapper_content = section_wrapper_path.read_text(encoding="utf-8")
-        wrapper_template = self.template_registry.env.from_string(section_wrapper_content)
 
         # Extract metadata fields (metadata is required, name is required within it)
         metadata = section_data["metadata"]
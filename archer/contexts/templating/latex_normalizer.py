@@ -60,6 +60,9 @@ LOGS_PATH = Path(os.getenv("LOGS_PATH", "outs/logs"))
 # Marker in process_file message indicating content was identical, used to skip registry updates
 CONTENT_UNCHANGED_TAG = "[unchanged - skipped write]"
 
+# Matched at an offset with pos= so the tail of the document is not copied
+DECORATIONS_FOLLOWING_TEXTBLOCK_RE = re.compile(PageRegex.DECORATIONS_FOLLOWING_TEXTBLOCK)
+
 # ============================================================================
 # Result Dataclass
 # ============================================================================
@@ -112,8 +115,7 @@ def normalize_textblock_position(content: str) -> str:
 
         # Also capture any decoration commands immediately following textblock
         # (leftgrad, bottombar commands that are part of the decoration set)
-        remaining = content[end:]
-        decorations_match = re.match(PageRegex.DECORATIONS_FOLLOWING_TEXTBLOCK, remaining)
+        decorations_match = DECORATIONS_FOLLOWING_TEXTBLOCK_RE.match(content, end)
         if decorations_match:
             textblock_full += decorations_match.group(0)
             end += len(decorations_match.group(0))
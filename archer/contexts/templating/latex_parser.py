@@ -8,11 +8,11 @@ import copy
 import os
 import re
 import warnings
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from dotenv import load_dotenv
-from omegaconf import OmegaConf
 
 from archer.contexts.templating.exceptions import TemplateParsingError
 from archer.contexts.templating.latex_patterns import (
@@ -29,7 +29,12 @@ from archer.contexts.templating.latex_patterns import (
     SectionRegex,
     regex_to_literal,
 )
-from archer.contexts.templating.registries import ParseConfigRegistry, TemplateRegistry
+from archer.contexts.templating.registries import (
+    ParseConfigRegistry,
+    TemplateRegistry,
+    get_default_parse_config_registry,
+    get_default_template_registry,
+)
 from archer.utils.latex_parsing_tools import (
     extract_all_environments,
     extract_brace_arguments,
@@ -43,14 +48,67 @@ from archer.utils.latex_parsing_tools import (
 from archer.utils.text_processing import (
     extract_balanced_delimiters,
     extract_regex_matches,
+    iter_split,
     set_max_consecutive_blank_lines,
 )
+from archer.utils.yaml_io import load_yaml
 
 load_dotenv()
-TYPES_PATH = Path(os.getenv("RESUME_COMPONENT_TYPES_PATH"))
-TEMPLATING_CONTEXT_PATH = Path(os.getenv("TEMPLATING_CONTEXT_PATH"))
 USER_PROFILE_PATH = Path(os.getenv("USER_PROFILE_PATH"))
 
+# Section type inference runs once per section, so compile its patterns up front
+BEGIN_ITEMIZE_ANY_RE = re.compile(EnvironmentPatterns.BEGIN_ITEMIZE_ANY)
+ITEMIZE_ACADEMIC_TOKEN_RE = re.compile(
+    f"(?P<begin>{EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC})"
+    f"|(?P<end>{EnvironmentPatterns.END_ITEMIZE_ACADEMIC})"
+)
+EDUCATION_ICON_BULLET_RE = re.compile(EnvironmentPatterns.EDUCATION_ICON_BULLET)
+
+# Fixed-string inference sentinels: substring tests (C-level find) instead of regex searches
+BEGIN_ITEMIZE_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE)
+BEGIN_ITEMIZE_LL_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_LL)
+BEGIN_ITEMIZE_PROJ_MAIN_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_PROJ_MAIN)
+BEGIN_ITEMIZE_ACADEMIC_LITERAL = regex_to_literal(EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC)
+ITEM_BRACKET_LITERAL = r"\item["  # EnvironmentPatterns.ITEM_BRACKET as plain text
+
+# Paracol wrapper re-added around each page segment in extract_pages
+BEGIN_PARACOL_LITERAL = regex_to_literal(PageRegex.BEGIN_PARACOL)
+END_PARACOL_LITERAL = regex_to_literal(PageRegex.END_PARACOL)
+
+# Preamble metadata patterns
+RENEWCOMMAND_WITH_VALUE_RE = re.compile(MetadataRegex.RENEWCOMMAND_WITH_VALUE)
+SETLENGTH_RE = re.compile(MetadataRegex.SETLENGTH)
+DEFLEN_RE = re.compile(MetadataRegex.DEFLEN)
+SETHLCOLOR_RE = re.compile(MetadataRegex.SETHLCOLOR)
+NLINESPP_RE = re.compile(MetadataRegex.NLINESPP)
+LIST_TITLE_AFTER_NAME_RE = re.compile(MetadataRegex.LIST_TITLE_AFTER_NAME)
+USEPACKAGE_RE = re.compile(MetadataRegex.USEPACKAGE)
+NEWFONTFAMILY_RE = re.compile(MetadataRegex.NEWFONTFAMILY)
+HREF_TEXT_RE = re.compile(r"\\href\{[^}]*\}\{([^}]*)\}")
+
+# Closing delimiters searched from a known offset (pos= avoids slicing the page)
+END_TEXTBLOCK_STAR_RE = re.compile(EnvironmentPatterns.END_TEXTBLOCK_STAR)
+END_PARACOL_RE = re.compile(PageRegex.END_PARACOL)
+
+# Document, page and column structure patterns (used once per page/column/section)
+BEGIN_DOCUMENT_RE = re.compile(DocumentRegex.BEGIN_DOCUMENT)
+END_DOCUMENT_RE = re.compile(DocumentRegex.END_DOCUMENT)
+CLEARPAGE_WITH_WHITESPACE_RE = re.compile(DocumentRegex.CLEARPAGE_WITH_WHITESPACE)
+BEGIN_PARACOL_RE = re.compile(PageRegex.BEGIN_PARACOL)
+SWITCHCOLUMN_RE = re.compile(PageRegex.SWITCHCOLUMN)
+LEFTGRAD_RE = re.compile(PageRegex.LEFTGRAD)
+BOTTOMBAR_RE = re.compile(PageRegex.BOTTOMBAR)
+TOPGRADTRI_RE = re.compile(PageRegex.TOPGRADTRI)
+TEXTBLOCK_WITH_ARGS_RE = re.compile(EnvironmentPatterns.TEXTBLOCK_WITH_ARGS)
+BEGIN_TEXTBLOCK_STAR_RE = re.compile(EnvironmentPatterns.BEGIN_TEXTBLOCK_STAR)
+SECTION_WITH_NAME_RE = re.compile(SectionRegex.SECTION_WITH_NAME)
+OLD_EDUCATION_HEADER_RE = re.compile(SectionRegex.OLD_EDUCATION_HEADER)
+TRAILING_VSPACE_RE = re.compile(SectionRegex.TRAILING_VSPACE)
+
+# Metadata field name lists, built once instead of per extract_document_metadata() call
+COLOR_FIELDS = tuple(ColorFields.all())
+STANDARD_PACKAGE_ARGS = tuple(f"{{{pkg}}}" for pkg in PreamblePatterns.all())
+
 
 def get_nested_field(data: Dict, field_path: str) -> Any:
     """
@@ -178,9 +236,9 @@ class LaTeXToYAMLConverter:
         parse_config_registry: ParseConfigRegistry = None,
         profile_path: Path = USER_PROFILE_PATH,
     ):
-        self.template_registry = template_registry or TemplateRegistry()
-        self.parse_config_registry = parse_config_registry or ParseConfigRegistry()
-        self.user_profile = OmegaConf.load(profile_path)
+        self.template_registry = template_registry or get_default_template_registry()
+        self.parse_config_registry = parse_config_registry or get_default_parse_config_registry()
+        self.user_profile = load_yaml(profile_path)
 
     def _parse_contact_info(self, preamble: str) -> Dict[str, Any]:
         """
@@ -233,7 +291,7 @@ class LaTeXToYAMLConverter:
             # For plain rows: value & icon
             if "\\href{" in row:
                 # Extract value from second \href argument
-                href_match = re.search(r"\\href\{[^}]*\}\{([^}]*)\}", row)
+                href_match = HREF_TEXT_RE.search(row)
                 if href_match:
                     registry[field_type] = href_match.group(1)
             else:
@@ -243,8 +301,8 @@ class LaTeXToYAMLConverter:
                     registry[field_type] = parts[0].strip()
 
         # Compare with defaults
-        default_selection = list(self.user_profile.contact_selection)
-        default_registry = dict(self.user_profile.contact_registry)
+        default_selection = list(self.user_profile["contact_selection"])
+        default_registry = dict(self.user_profile["contact_registry"])
 
         # Determine if selection differs from default
         selection_override = None
@@ -383,16 +441,18 @@ class LaTeXToYAMLConverter:
                 if operation_config.get("keep_delimiter", False):
                     delimiter = f"(?={delimiter})"
 
-                # Split content
-                parts = re.split(delimiter, content_source)
+                # Split content (pieces are produced lazily, one per separator)
+                parts = iter_split(content_source, delimiter)
 
                 # Clean up parts if cleanup_pattern provided
                 cleanup_pattern = patterns.get("cleanup")
                 if cleanup_pattern:
-                    parts = [re.sub(cleanup_pattern, "", part) for part in parts]
+                    # Compile once for all parts rather than a cache lookup per re.sub call
+                    cleanup_regex = re.compile(cleanup_pattern)
+                    parts = (cleanup_regex.sub("", part) for part in parts)
 
-                # Filter empty parts and set value
-                value = [p.strip() for p in parts if p.strip()]
+                # Filter empty parts and set value (strip each part once)
+                value = [stripped for stripped in map(str.strip, parts) if stripped]
 
             elif operation == "parse_itemize_content":
                 # Parse itemize content using resolved marker pattern (with fallback)
@@ -417,10 +477,9 @@ class LaTeXToYAMLConverter:
                     chunks = content_source
                     nested_config = self.parse_config_registry.get_config(config_name)
 
-                    nested_results = []
-                    for chunk in chunks:
-                        nested_result = self.parse_with_config(chunk, nested_config)
-                        nested_results.append(nested_result)
+                    nested_results = [
+                        self.parse_with_config(chunk, nested_config) for chunk in chunks
+                    ]
 
                     if nested_results:
                         set_nested_field(result, output_path, nested_results)
@@ -435,33 +494,45 @@ class LaTeXToYAMLConverter:
 
                     if environments:
                         nested_config = self.parse_config_registry.get_config(config_name)
-                        nested_results = []
-
-                        # Clean input content by removing nested environments
-                        cleaned_content = content_source
-                        for env_name, _, _, begin_pos, end_pos in reversed(environments):
-                            cleaned_content = (
-                                cleaned_content[:begin_pos] + cleaned_content[end_pos:]
-                            )
+                        # One result per environment - allocate up front and fill by index
+                        nested_results = [None] * len(environments)
+                        configs_by_env_name = {}
+
+                        # Clean input content by removing nested environments: keep the
+                        # text between them, collected in one pass over the known offsets
+                        kept = []
+                        last = 0
+                        for _, _, _, begin_pos, end_pos in environments:
+                            if begin_pos > last:
+                                kept.append(content_source[last:begin_pos])
+                            last = max(last, end_pos)
+                        kept.append(content_source[last:])
+                        cleaned_content = "".join(kept)
 
                         # Update context with cleaned content (for bullets extraction)
                         context["environment_content"] = cleaned_content
 
-                        for env_name, _, _, begin_pos, end_pos in environments:
+                        for i, (env_name, _, _, begin_pos, end_pos) in enumerate(environments):
                             # Get full environment LaTeX (with begin/end tags)
                             nested_latex = content_source[begin_pos:end_pos]
 
                             # Substitute {{{PROJECT_ENVIRONMENT_NAME}}} if present in config
-                            config_copy = copy.deepcopy(nested_config)
-                            if (
-                                "operations" in config_copy
-                                and "environment" in config_copy["operations"]
-                            ):
+                            # (memoized per environment name; siblings usually share one)
+                            config_copy = configs_by_env_name.get(env_name)
+                            if config_copy is None:
+                                config_copy = copy.deepcopy(nested_config)
                                 if (
-                                    config_copy["operations"]["environment"].get("env_name")
-                                    == "{{{PROJECT_ENVIRONMENT_NAME}}}"
+                                    "operations" in config_copy
+                                    and "environment" in config_copy["operations"]
                                 ):
-                                    config_copy["operations"]["environment"]["env_name"] = env_name
+                                    if (
+                                        config_copy["operations"]["environment"].get("env_name")
+                                        == "{{{PROJECT_ENVIRONMENT_NAME}}}"
+                                    ):
+                                        config_copy["operations"]["environment"]["env_name"] = (
+                                            env_name
+                                        )
+                                configs_by_env_name[env_name] = config_copy
 
                             # Parse recursively
                             nested_result = self.parse_with_config(nested_latex, config_copy)
@@ -471,7 +542,7 @@ class LaTeXToYAMLConverter:
                                 nested_result["metadata"] = {}
                             nested_result["metadata"]["environment_type"] = env_name
 
-                            nested_results.append(nested_result)
+                            nested_results[i] = nested_result
 
                         set_nested_field(result, output_path, nested_results)
 
@@ -546,7 +617,7 @@ class LaTeXToYAMLConverter:
         """
 
         # Find preamble (everything before \begin{document})
-        doc_match = re.search(DocumentRegex.BEGIN_DOCUMENT, latex_str)
+        doc_match = BEGIN_DOCUMENT_RE.search(latex_str)
         if not doc_match:
             raise ValueError("No \begin{document} found")
 
@@ -554,77 +625,52 @@ class LaTeXToYAMLConverter:
 
         # Extract all \renewcommand fields (handle nested braces)
         renewcommands = {}
-        renewcommand_starts = [
-            m.start() for m in re.finditer(MetadataRegex.RENEWCOMMAND_START, preamble)
-        ]
-
-        for start_pos in renewcommand_starts:
-            # Extract field name (first {...})
-            field_name_match = re.match(MetadataRegex.RENEWCOMMAND_FIELD, preamble[start_pos:])
-            if not field_name_match:
-                continue
-            field_name = field_name_match.group(1)
-
-            # Find start of value (second {...})
-            value_start = start_pos + field_name_match.end()
-            if value_start >= len(preamble) or preamble[value_start] != "{":
-                continue
-
+        # One pass: each match captures the field name and ends just inside the value's brace
+        for match in RENEWCOMMAND_WITH_VALUE_RE.finditer(preamble):
             # Extract value using balanced delimiter helper
             try:
-                field_value, _ = extract_balanced_delimiters(preamble, value_start + 1)
-                renewcommands[field_name] = field_value
+                field_value, _ = extract_balanced_delimiters(preamble, match.end())
+                renewcommands[match.group(1)] = field_value
             except ValueError:
                 # Skip malformed \renewcommand
                 continue
 
         # Extract \setlength parameters (same pattern as \renewcommand)
-        setlengths = {}
-        for match in re.finditer(MetadataRegex.SETLENGTH, preamble):
-            param_name = match.group(1)
-            param_value = match.group(2)
-            setlengths[param_name] = param_value
+        setlengths = dict(match.groups() for match in SETLENGTH_RE.finditer(preamble))
 
         # Extract \deflen parameters
-        deflens = {}
-        for match in re.finditer(MetadataRegex.DEFLEN, preamble):
-            param_name = match.group(1)
-            param_value = match.group(2)
-            deflens[param_name] = param_value
+        deflens = dict(match.groups() for match in DEFLEN_RE.finditer(preamble))
 
         # Extract \sethlcolor
         hlcolor = None
-        hlcolor_match = re.search(MetadataRegex.SETHLCOLOR, preamble)
+        hlcolor_match = SETHLCOLOR_RE.search(preamble)
         if hlcolor_match:
             hlcolor = hlcolor_match.group(1)
 
         # Extract \def\nlinesPP{...}
         nlines_pp = None
-        nlines_pp_match = re.search(MetadataRegex.NLINESPP, preamble)
+        nlines_pp_match = NLINESPP_RE.search(preamble)
         if nlines_pp_match:
             nlines_pp = int(nlines_pp_match.group(1))
 
         # Extract \toggletrue/false{list_title_after_name}
         list_title_after_name = True  # Default to true
-        toggle_match = re.search(MetadataRegex.LIST_TITLE_AFTER_NAME, preamble)
+        toggle_match = LIST_TITLE_AFTER_NAME_RE.search(preamble)
         if toggle_match:
             list_title_after_name = toggle_match.group(1) == "true"
 
         # Extract custom package declarations (e.g., \usepackage{fontspec} + \newfontfamily)
         # Filter out standard packages that are generated by template
-        standard_packages = PreamblePatterns.all()
         custom_packages = []
-        for match in re.finditer(MetadataRegex.USEPACKAGE, preamble):
+        for match in USEPACKAGE_RE.finditer(preamble):
             package_line = match.group(0)
             # Check if this is a standard package (skip if it is)
-            is_standard = any(f"{{{pkg}}}" in package_line for pkg in standard_packages)
-            if not is_standard:
+            if not any(pkg_arg in package_line for pkg_arg in STANDARD_PACKAGE_ARGS):
                 custom_packages.append(package_line)
-        for match in re.finditer(MetadataRegex.NEWFONTFAMILY, preamble):
-            custom_packages.append(match.group(0))
+        custom_packages.extend(match.group(0) for match in NEWFONTFAMILY_RE.finditer(preamble))
 
         # Color fields
-        colors = {k: renewcommands.pop(k) for k in ColorFields.all() if k in renewcommands}
+        colors = {k: renewcommands.pop(k) for k in COLOR_FIELDS if k in renewcommands}
 
         # Known metadata fields - store RAW (exact LaTeX)
         name_raw = renewcommands.pop(MetadataPatterns.MYNAME, "")
@@ -745,7 +791,7 @@ class LaTeXToYAMLConverter:
         include_minor = "Minor in Neuroscience" in latex_str
 
         # Detect bullet style: \item[\faUserGraduate] vs \itemi
-        use_icon_bullets = bool(re.search(EnvironmentPatterns.EDUCATION_ICON_BULLET, latex_str))
+        use_icon_bullets = bool(EDUCATION_ICON_BULLET_RE.search(latex_str))
 
         return {
             "type": "education",
@@ -838,8 +884,8 @@ class LaTeXToYAMLConverter:
         """
 
         # Find document content (between \begin{document} and \end{document})
-        doc_start = re.search(DocumentRegex.BEGIN_DOCUMENT, latex_str)
-        doc_end = re.search(DocumentRegex.END_DOCUMENT, latex_str)
+        doc_start = BEGIN_DOCUMENT_RE.search(latex_str)
+        doc_end = END_DOCUMENT_RE.search(latex_str)
 
         if not doc_start or not doc_end:
             raise ValueError("Document markers not found")
@@ -847,8 +893,8 @@ class LaTeXToYAMLConverter:
         document_content = latex_str[doc_start.end() : doc_end.start()]
 
         # Find paracol environment boundaries
-        paracol_start_match = re.search(PageRegex.BEGIN_PARACOL, document_content)
-        paracol_end_match = re.search(PageRegex.END_PARACOL, document_content)
+        paracol_start_match = BEGIN_PARACOL_RE.search(document_content)
+        paracol_end_match = END_PARACOL_RE.search(document_content)
 
         if not paracol_start_match or not paracol_end_match:
             raise ValueError("No paracol environment found")
@@ -856,28 +902,30 @@ class LaTeXToYAMLConverter:
         # Extract content within paracol (this is what we'll split on \clearpage)
         paracol_content = document_content[paracol_start_match.end() : paracol_end_match.start()]
 
-        # Count clearpage markers to determine which pages have clearpage after them
-        clearpage_count = len(re.findall(DocumentRegex.CLEARPAGE_WITH_WHITESPACE, paracol_content))
-
-        # Split on \clearpage to get pages
-        page_segments = re.split(DocumentRegex.CLEARPAGE_WITH_WHITESPACE, paracol_content)
+        # Split on \clearpage to get pages, slicing each segment as its marker is found.
+        # Every segment except the last is followed by a \clearpage (None marks the end).
+        clearpage_matches = chain(CLEARPAGE_WITH_WHITESPACE_RE.finditer(paracol_content), [None])
 
         pages = []
-        for page_num, page_content in enumerate(page_segments, start=1):
+        segment_start = 0
+        for page_num, clearpage_match in enumerate(clearpage_matches, start=1):
+            has_clearpage_after = clearpage_match is not None
+            if has_clearpage_after:
+                page_content = paracol_content[segment_start : clearpage_match.start()]
+                segment_start = clearpage_match.end()
+            else:
+                page_content = paracol_content[segment_start:]
+
             if not page_content.strip():
                 continue
 
             # Wrap segment in paracol for extract_page_regions() to work
-            wrapped_content = f"{regex_to_literal(PageRegex.BEGIN_PARACOL)}\n{page_content}\n{regex_to_literal(PageRegex.END_PARACOL)}"
+            wrapped_content = f"{BEGIN_PARACOL_LITERAL}\n{page_content}\n{END_PARACOL_LITERAL}"
 
             try:
                 # Extract regions for this page
                 page_regions = self.extract_page_regions(wrapped_content, page_number=page_num)
 
-                # Determine if this page has clearpage after it
-                # Pages 1 through clearpage_count have clearpage, remaining pages don't
-                has_clearpage_after = page_num <= clearpage_count
-
                 pages.append(
                     {
                         "page_number": page_num,
@@ -907,7 +955,7 @@ class LaTeXToYAMLConverter:
         decorations = []
 
         # Extract textblock arguments if present
-        textblock_match = re.search(EnvironmentPatterns.TEXTBLOCK_WITH_ARGS, latex_str)
+        textblock_match = TEXTBLOCK_WITH_ARGS_RE.search(latex_str)
         if textblock_match:
             # Group 1: {width}, Group 2: (x, y)
             width_arg = textblock_match.group(1).strip("{}")
@@ -920,24 +968,22 @@ class LaTeXToYAMLConverter:
             textblock_start = textblock_match.start()
             try:
                 _, _, end_start_pos = extract_environment_content(latex_str, "textblock*")
-                end_match = re.search(
-                    EnvironmentPatterns.END_TEXTBLOCK_STAR, latex_str[end_start_pos:]
-                )
+                end_match = END_TEXTBLOCK_STAR_RE.search(latex_str, end_start_pos)
                 if end_match:
-                    textblock_end = end_start_pos + end_match.end()
+                    textblock_end = end_match.end()
                     # Remove textblock environment
                     latex_str = latex_str[:textblock_start] + latex_str[textblock_end:]
             except ValueError:
                 pass
 
         # Extract leftgrad commands before removing
-        for match in re.finditer(PageRegex.LEFTGRAD, latex_str):
+        for match in LEFTGRAD_RE.finditer(latex_str):
             command_str = match.group(0)
             args = extract_brace_arguments(command_str)
             decorations.append({"command": "leftgrad", "args": args})
 
         # Extract bottombar commands before removing
-        for match in re.finditer(PageRegex.BOTTOMBAR, latex_str):
+        for match in BOTTOMBAR_RE.finditer(latex_str):
             command_str = match.group(0)
             args = extract_brace_arguments(command_str)
             decorations.append({"command": "bottombar", "args": args})
@@ -949,16 +995,16 @@ class LaTeXToYAMLConverter:
             decorations.append({"command": "topgrad", "args": args})
 
         # Extract topgradtri commands before removing
-        for match in re.finditer(PageRegex.TOPGRADTRI, latex_str):
+        for match in TOPGRADTRI_RE.finditer(latex_str):
             command_str = match.group(0)
             args = extract_brace_arguments(command_str)
             decorations.append({"command": "topgradtri", "args": args})
 
         # Remove decoration commands
-        latex_str = re.sub(PageRegex.LEFTGRAD, "", latex_str)
-        latex_str = re.sub(PageRegex.BOTTOMBAR, "", latex_str)
+        latex_str = LEFTGRAD_RE.sub("", latex_str)
+        latex_str = BOTTOMBAR_RE.sub("", latex_str)
         latex_str = re.sub(PageRegex.TOPGRAD, "", latex_str)
-        latex_str = re.sub(PageRegex.TOPGRADTRI, "", latex_str)
+        latex_str = TOPGRADTRI_RE.sub("", latex_str)
 
         return latex_str, decorations
 
@@ -983,7 +1029,7 @@ class LaTeXToYAMLConverter:
             Dict with content_latex (raw LaTeX string), or None if no textblock found
         """
         # Check if textblock exists using pattern from EnvironmentPatterns
-        if not re.search(EnvironmentPatterns.BEGIN_TEXTBLOCK_STAR, latex_str):
+        if not BEGIN_TEXTBLOCK_STAR_RE.search(latex_str):
             return None
 
         # Extract textblock environment content using helper
@@ -1026,32 +1072,37 @@ class LaTeXToYAMLConverter:
         latex_str, decorations = self._extract_and_remove_decorations(latex_str)
 
         # Find paracol environment
-        paracol_match = re.search(PageRegex.BEGIN_PARACOL, latex_str)
+        paracol_match = BEGIN_PARACOL_RE.search(latex_str)
         if not paracol_match:
             raise ValueError("No \begin{paracol} found")
 
         paracol_start = paracol_match.end()
 
         # Find \end{paracol}
-        end_match = re.search(PageRegex.END_PARACOL, latex_str[paracol_start:])
+        end_match = END_PARACOL_RE.search(latex_str, paracol_start)
         if not end_match:
             raise ValueError("No matching \end{paracol} found")
 
-        paracol_content = latex_str[paracol_start : paracol_start + end_match.start()]
+        paracol_content = latex_str[paracol_start : end_match.start()]
 
         # Find \switchcolumn (optional for continuation pages)
-        switch_match = re.search(PageRegex.SWITCHCOLUMN, paracol_content)
+        switch_match = SWITCHCOLUMN_RE.search(paracol_content)
 
         if switch_match:
             # Has both columns
             left_content = paracol_content[: switch_match.start()].strip()
             main_content = paracol_content[switch_match.end() :].strip()
 
-            left_sections = self._extract_sections_from_column(
-                left_content, region_name="left_column"
+            # Skip section scanning for an empty column
+            left_sections = (
+                self._extract_sections_from_column(left_content, region_name="left_column")
+                if left_content
+                else []
             )
-            main_sections = self._extract_sections_from_column(
-                main_content, region_name="main_column"
+            main_sections = (
+                self._extract_sections_from_column(main_content, region_name="main_column")
+                if main_content
+                else []
             )
         else:
             # No switchcolumn - all content is in main column (continuation page)
@@ -1085,60 +1136,41 @@ class LaTeXToYAMLConverter:
         sections = []
 
         # Find all section boundaries (both standard \section* and old Education header)
+        # as (start, end, name) tuples: start of the header, position after it, section name
         section_markers = []
 
         # Find standard \section* markers
-        for match in re.finditer(SectionRegex.SECTION_WITH_NAME, column_content):
+        for match in SECTION_WITH_NAME_RE.finditer(column_content):
             # Extract section name with balanced brace matching (handles nested braces)
             try:
                 brace_pos = match.end()  # Position after '\section*{'
                 section_name, end_pos = extract_balanced_delimiters(
                     column_content, brace_pos, open_char="{", close_char="}"
                 )
-                section_markers.append(
-                    {
-                        "start": match.start(),
-                        "end": end_pos,  # Position after closing }
-                        "name": section_name.strip(),
-                        "type": "standard",
-                    }
-                )
+                # end_pos is the position after the closing }
+                section_markers.append((match.start(), end_pos, section_name.strip()))
             except ValueError:
                 # Skip malformed section with unbalanced braces
                 continue
 
         # Find old Education header (5 resumes use non-standard format)
-        for match in re.finditer(SectionRegex.OLD_EDUCATION_HEADER, column_content):
-            section_markers.append(
-                {
-                    "start": match.start(),
-                    "end": match.end(),
-                    "name": "Education",
-                    "type": "old_education",
-                }
-            )
-
-        # Sort by position
-        section_markers.sort(key=lambda x: x["start"])
+        for match in OLD_EDUCATION_HEADER_RE.finditer(column_content):
+            section_markers.append((match.start(), match.end(), "Education"))
 
         if not section_markers:
             return sections
 
-        for i, marker in enumerate(section_markers):
-            section_name = marker["name"]
-
-            # Get content from after this section header to before next section
-            content_start = marker["end"]
-            if i + 1 < len(section_markers):
-                content_end = section_markers[i + 1]["start"]
-            else:
-                content_end = len(column_content)
+        # Sort by position; each section's content runs up to the next header's start
+        section_markers.sort()
+        content_ends = [marker[0] for marker in section_markers[1:]]
+        content_ends.append(len(column_content))
 
+        for (_, content_start, section_name), content_end in zip(section_markers, content_ends):
             section_content = column_content[content_start:content_end].strip()
 
             # Extract trailing \vspace{...} as section spacing metadata
             spacing_after = None
-            vspace_match = re.search(SectionRegex.TRAILING_VSPACE, section_content)
+            vspace_match = TRAILING_VSPACE_RE.search(section_content)
             if vspace_match:
                 spacing_after = vspace_match.group(1)  # e.g., "2.8\sectionsep"
                 # Strip vspace from content
@@ -1187,32 +1219,34 @@ class LaTeXToYAMLConverter:
         """
 
         # Try to infer type from content structure
-        if re.search(EnvironmentPatterns.BEGIN_ITEMIZE_PROJ_MAIN, content):
+        if BEGIN_ITEMIZE_PROJ_MAIN_LITERAL in content:
             # Standalone projects section (about half of historical resumes use this)
             parsed = self.parse_projects(content)
             return {"type": "projects", "metadata": {}, "subsections": parsed["subsections"]}
 
-        elif re.search(EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC, content):
+        elif BEGIN_ITEMIZE_ACADEMIC_LITERAL in content:
             # Work experience section
             # Parse all work experience subsections
+            # Pair each \begin{itemizeAcademic} with the next \end{itemizeAcademic}
+            # in one pass over begin/end tokens
             subsections = []
-            begin_pattern = EnvironmentPatterns.BEGIN_ITEMIZE_ACADEMIC
-            for match in re.finditer(begin_pattern, content):
-                # Find corresponding \end{itemizeAcademic}
-                start = match.start()
-                end_pattern = EnvironmentPatterns.END_ITEMIZE_ACADEMIC
-                end_match = re.search(end_pattern, content[start:])
-                if end_match:
-                    subsection_latex = content[start : start + end_match.end()]
+            start = None
+            for token in ITEMIZE_ACADEMIC_TOKEN_RE.finditer(content):
+                if token.lastgroup == "begin":
+                    if start is None:
+                        start = token.start()
+                elif start is not None:
+                    subsection_latex = content[start : token.end()]
                     subsection = self.parse_work_experience(subsection_latex)
                     subsections.append(subsection)
+                    start = None
 
             return {"type": "work_history", "metadata": {}, "subsections": subsections}
 
-        elif (
-            re.search(EnvironmentPatterns.BEGIN_ITEMIZE, content)
-            and ContentPatterns.EDUCATION_UNIVERSITY in content
-        ):
+        # Tested by three of the branches below, so scan for it once
+        has_itemize = BEGIN_ITEMIZE_LITERAL in content
+
+        if has_itemize and ContentPatterns.EDUCATION_UNIVERSITY in content:
             # education (check before skill_categories - more specific pattern)
             parsed = self.parse_education(content)
             return {
@@ -1222,9 +1256,7 @@ class LaTeXToYAMLConverter:
             }
 
         elif (
-            re.search(EnvironmentPatterns.BEGIN_ITEMIZE, content)
-            and re.search(EnvironmentPatterns.ITEM_BRACKET, content)
-            and re.search(EnvironmentPatterns.BEGIN_ITEMIZE_LL, content)
+            has_itemize and BEGIN_ITEMIZE_LL_LITERAL in content and ITEM_BRACKET_LITERAL in content
         ):
             # skill_categories - outer itemize with \item[icon]Name + nested itemizeLL
             parsed = self.parse_skill_categories(content)
@@ -1235,8 +1267,8 @@ class LaTeXToYAMLConverter:
             }
 
         elif (
-            FormattingPatterns.SETLENGTH in content
-            and FormattingPatterns.BASELINESKIP in content
+            FormattingPatterns.BASELINESKIP in content
+            and FormattingPatterns.SETLENGTH in content
             and FormattingPatterns.SCSHAPE in content
         ):
             # skill_list_caps
@@ -1248,9 +1280,7 @@ class LaTeXToYAMLConverter:
             parsed = self.parse_skill_list_pipes(content)
             return {"type": "skill_list_pipes", "metadata": {}, "content": parsed["content"]}
 
-        elif region_name == "left_column" and re.search(
-            EnvironmentPatterns.BEGIN_ITEMIZE_ANY, content
-        ):
+        elif region_name == "left_column" and BEGIN_ITEMIZE_ANY_RE.search(content):
             # personality_alias_array - Left column itemize variants (itemizeMain, itemizeLL)
             # All left-column itemize sections are personality sections (verified empirically)
             parsed = self.parse_personality_alias_array(content)
@@ -1260,7 +1290,7 @@ class LaTeXToYAMLConverter:
                 "content": parsed["content"],
             }
 
-        elif re.search(EnvironmentPatterns.BEGIN_ITEMIZE, content):
+        elif has_itemize:
             # custom_itemize - Vanilla itemize with optional params and/or custom item markers
             # Check for exact \begin{itemize} match (not itemizeLL, itemizeMain, etc.)
             # This handles sections like "HPC Highlights" that use standard itemize environment
@@ -1271,7 +1301,7 @@ class LaTeXToYAMLConverter:
                 "content": parsed["content"],
             }
 
-        elif re.search(EnvironmentPatterns.BEGIN_ITEMIZE_ANY, content):
+        elif BEGIN_ITEMIZE_ANY_RE.search(content):
             # simple_list - Fallback for custom itemize variants (itemizeLL, etc.)
             # This should rarely be reached now that left_column itemize is handled above
             parsed = self._parse_as_simple_list(content)
@@ -256,6 +256,9 @@ class MetadataRegex:
     # Composed patterns for finding \renewcommand structures
     RENEWCOMMAND_START: str = r"\\renewcommand\{\\"  # Start of \renewcommand{\ pattern
     RENEWCOMMAND_FIELD: str = r"\\renewcommand\{\\([^}]+)\}"  # Captures field name
+    RENEWCOMMAND_WITH_VALUE: str = (
+        r"\\renewcommand\{\\([^}]+)\}\{"  # Captures field name, ends after value's opening {
+    )
 
     # Spacing and layout parameters
     SETLENGTH: str = r"\\setlength\{\\([^}]+)\}\{([^}]+)\}"  # Captures param name and value
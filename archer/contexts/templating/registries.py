@@ -5,15 +5,33 @@ Centralized registries for loading and caching templates and parsing configs.
 """
 
 import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from dotenv import load_dotenv
+import yaml
 from jinja2 import Environment, FileSystemLoader, StrictUndefined, Template, TemplateNotFound
-from omegaconf import OmegaConf
 
-load_dotenv()
-TYPES_PATH = Path(os.getenv("RESUME_COMPONENT_TYPES_PATH"))
+from archer.utils.yaml_io import YAMLSafeLoader
+
+
+@lru_cache(maxsize=1)
+def get_types_path() -> Path:
+    """
+    Resolve RESUME_COMPONENT_TYPES_PATH from the environment (loading .env on first call).
+
+    Resolved lazily so importing this module (or passing an explicit types_base_path)
+    doesn't parse .env or require the variable to be set.
+
+    Returns:
+        Base path for type directories
+    """
+    # Lazy import - dotenv is only needed when falling back to the environment
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Path(os.getenv("RESUME_COMPONENT_TYPES_PATH"))
 
 
 class TemplateRegistry:
@@ -35,7 +53,7 @@ class TemplateRegistry:
                            RESUME_COMPONENT_TYPES_PATH from environment
         """
         if types_base_path is None:
-            types_base_path = TYPES_PATH
+            types_base_path = get_types_path()
 
         self.types_base_path = types_base_path
         self._cache: Dict[str, Template] = {}
@@ -176,10 +194,11 @@ class ParseConfigRegistry:
                            RESUME_COMPONENT_TYPES_PATH from environment
         """
         if types_base_path is None:
-            types_base_path = TYPES_PATH
+            types_base_path = get_types_path()
 
         self.types_base_path = types_base_path
         self._cache: Dict[str, Dict[str, Any]] = {}
+        self._env_name_cache: Dict[str, str] = {}
 
     def get_config(self, type_name: str) -> Dict[str, Any]:
         """
@@ -199,17 +218,45 @@ class ParseConfigRegistry:
 
         config_path = self.get_config_path(type_name)
 
-        if not config_path.exists():
+        # Parse configs are plain YAML (no interpolation), so skip the OmegaConf round trip.
+        # A missing file surfaces from open() itself rather than a separate exists() stat.
+        try:
+            with config_path.open("rb") as f:
+                config_dict = yaml.load(f, Loader=YAMLSafeLoader)
+        except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"Parse config not found for type '{type_name}' at {config_path}"
-            )
-
-        config = OmegaConf.load(config_path)
-        config_dict = OmegaConf.to_container(config, resolve=True)
+            ) from e
 
         self._cache[type_name] = config_dict
         return config_dict
 
+    def get_environment_name(self, type_name: str) -> str:
+        """
+        Get the LaTeX environment name declared by a type's environment operation.
+
+        Resolved once per type and interned, so generators can use it per subsection
+        without walking the nested config dict each time.
+
+        Args:
+            type_name: Name of the type (e.g., 'work_experience')
+
+        Returns:
+            Environment name (e.g., 'itemizeAcademic')
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist
+            KeyError: If the config has no operations.environment.env_name
+        """
+        if type_name in self._env_name_cache:
+            return self._env_name_cache[type_name]
+
+        config = self.get_config(type_name)
+        env_name = sys.intern(config["operations"]["environment"]["env_name"])
+
+        self._env_name_cache[type_name] = env_name
+        return env_name
+
     def get_config_path(self, type_name: str) -> Path:
         """
         Get the file path for a type's parsing config.
@@ -225,6 +272,7 @@ class ParseConfigRegistry:
     def clear_cache(self):
         """Clear the parsing config cache."""
         self._cache.clear()
+        self._env_name_cache.clear()
 
     def is_cached(self, type_name: str) -> bool:
         """
@@ -237,3 +285,35 @@ class ParseConfigRegistry:
             True if cached, False otherwise
         """
         return type_name in self._cache
+
+
+# Shared registries used when callers don't supply their own, so repeated
+# converter construction (e.g. batch conversions) reuses loaded templates/configs
+_default_template_registry: TemplateRegistry | None = None
+_default_parse_config_registry: ParseConfigRegistry | None = None
+
+
+def get_default_template_registry() -> TemplateRegistry:
+    """
+    Get the process-wide TemplateRegistry for the default types path.
+
+    Returns:
+        Shared TemplateRegistry instance (created on first call)
+    """
+    global _default_template_registry
+    if _default_template_registry is None:
+        _default_template_registry = TemplateRegistry()
+    return _default_template_registry
+
+
+def get_default_parse_config_registry() -> ParseConfigRegistry:
+    """
+    Get the process-wide ParseConfigRegistry for the default types path.
+
+    Returns:
+        Shared ParseConfigRegistry instance (created on first call)
+    """
+    global _default_parse_config_registry
+    if _default_parse_config_registry is None:
+        _default_parse_config_registry = ParseConfigRegistry()
+    return _default_parse_config_registry
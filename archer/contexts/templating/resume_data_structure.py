@@ -12,12 +12,12 @@ Targeting operates on ResumeDocument instances for analysis and content selectio
 """
 
 import re
+import tempfile
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from omegaconf import OmegaConf
 from tqdm import tqdm
 
 from archer.contexts.templating.converter import latex_to_yaml
@@ -26,7 +26,7 @@ from archer.contexts.templating.markdown_formatter import (
     format_subsections_markdown,
     format_work_experience_markdown,
 )
-from archer.contexts.templating.registries import TemplateRegistry
+from archer.contexts.templating.registries import get_default_template_registry
 from archer.utils.latex_parsing_tools import (
     LaTeXPatterns,
     extract_environment_content,
@@ -39,6 +39,7 @@ from archer.utils.resume_registry import (
     get_resume_status,
     list_resumes_by_type,
 )
+from archer.utils.yaml_io import load_yaml
 
 
 @dataclass
@@ -201,8 +202,7 @@ class ResumeDocument:
             raise FileNotFoundError(f"YAML file not found: {yaml_path}")
 
         self.mode = mode
-        yaml_data = OmegaConf.load(yaml_path)
-        yaml_dict = OmegaConf.to_container(yaml_data, resolve=True)
+        yaml_dict = load_yaml(yaml_path)
 
         if "document" not in yaml_dict:
             raise ValueError(f"Invalid YAML structure: missing 'document' key in {yaml_path}")
@@ -297,8 +297,6 @@ class ResumeDocument:
 
         try:
             # Create temporary YAML in memory
-            import tempfile
-
             with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
                 tmp_path = Path(tmp.name)
 
@@ -476,7 +474,7 @@ class ResumeDocument:
         metadata = section_data.get("metadata", {})
 
         # Render the education template to get actual content
-        template = TemplateRegistry().get_template("education")
+        template = get_default_template_registry().get_template("education")
         rendered = template.render({"metadata": metadata})
 
         # Extract itemize content and parse entries
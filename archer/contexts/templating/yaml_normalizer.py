@@ -20,7 +20,7 @@ This module makes ANY partial YAML complete and canonical, enabling:
 - Manual YAMLs → Complete YAML
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, Sequence, Tuple
 
 from archer.contexts.templating.defaults import SECTION_SPACING, get_default_metadata
 from archer.utils.latex_parsing_tools import to_latex, to_plaintext
@@ -37,13 +37,13 @@ def _sort_dict_keys(data: Any) -> Any:
 
 # Field pairs: (LaTeX-formatted field, plaintext field)
 # These pairs define which plaintext fields should be copied to LaTeX fields when missing
-ENFORCED_PAIRS = [
+ENFORCED_PAIRS = (
     ("latex_raw", "plaintext"),
     ("name", "name_plaintext"),
     ("brand", "brand_plaintext"),
     ("professional_profile", "professional_profile_plaintext"),
-]
-ALL_ENFORCED_FIELDS = [field for pair in ENFORCED_PAIRS for field in pair]
+)
+ALL_ENFORCED_FIELDS = frozenset(field for pair in ENFORCED_PAIRS for field in pair)
 
 
 def _add_document_defaults(data: Dict[str, Any]) -> None:
@@ -123,7 +123,58 @@ def _add_metadata_completeness(data: Any) -> None:
             _add_metadata_completeness(item)
 
 
-def clean_yaml(data: Any, top_level: bool = True) -> Any:
+def _enforce_field_pairs(data: Any) -> int:
+    """
+    Fill in missing halves of ENFORCED_PAIRS in-place throughout a YAML tree.
+
+    Walks the tree with an explicit stack rather than recursion, so deeply nested
+    YAML costs no Python frames per node and cannot hit the recursion limit.
+
+    Args:
+        data: YAML data structure (dict, list, or primitive)
+
+    Returns:
+        Number of LaTeX fields created from plaintext equivalents
+    """
+    enforced_pairs = ENFORCED_PAIRS
+    added = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            # Handle bidirectional field conversion
+            for latex_field, plaintext_field in enforced_pairs:
+                # Direction 1: plaintext → latex_raw (escaping)
+                if plaintext_field in node and latex_field not in node:
+                    plaintext_value = node[plaintext_field]
+                    if isinstance(plaintext_value, str):
+                        node[latex_field] = to_latex(plaintext_value)
+                    else:
+                        # Non-string values (e.g., None, int) pass through unchanged
+                        node[latex_field] = plaintext_value
+                    added += 1
+
+                # Direction 2: latex_raw → plaintext (unescaping)
+                elif latex_field in node and plaintext_field not in node:
+                    latex_value = node[latex_field]
+                    if isinstance(latex_value, str):
+                        node[plaintext_field] = to_plaintext(latex_value)
+                    else:
+                        # Non-string values (e.g., None, int) pass through unchanged
+                        node[plaintext_field] = latex_value
+
+            # Visit nested structures
+            stack.extend(node.values())
+
+        elif isinstance(node, list):
+            stack.extend(node)
+
+        # Primitives (str, int, bool, None) need no changes
+
+    return added
+
+
+def clean_yaml(data: Any, top_level: bool = True, return_count: bool = False) -> Any:
     """
     Minimal normalization for comparison and field pair enforcement.
 
@@ -135,57 +186,40 @@ def clean_yaml(data: Any, top_level: bool = True) -> Any:
     Does NOT add defaults, type inference, or structural completeness.
     Use normalize_yaml() for full normalization needed for LaTeX generation.
 
+    Field pairs are filled in-place, and the number of LaTeX fields created from
+    plaintext is tallied during the same pass, so counting needs no copy of the input.
+
     Args:
         data: YAML data structure (dict, list, or primitive)
-        top_level: If True, apply final key sorting (only at root call)
+        top_level: If True, apply final key sorting
+        return_count: If True, also return the number of LaTeX fields added
 
     Returns:
-        Cleaned data with field pairs normalized and keys sorted
+        Cleaned data with field pairs normalized and keys sorted,
+        or (cleaned_data, num_added) if return_count is True
     """
-    if isinstance(data, dict):
-        # Handle bidirectional field conversion
-        for latex_field, plaintext_field in ENFORCED_PAIRS:
-            # Direction 1: plaintext → latex_raw (escaping)
-            if plaintext_field in data and latex_field not in data:
-                plaintext_value = data[plaintext_field]
-                if isinstance(plaintext_value, str):
-                    data[latex_field] = to_latex(plaintext_value)
-                else:
-                    # Non-string values (e.g., None, int) pass through unchanged
-                    data[latex_field] = plaintext_value
-
-            # Direction 2: latex_raw → plaintext (unescaping)
-            elif latex_field in data and plaintext_field not in data:
-                latex_value = data[latex_field]
-                if isinstance(latex_value, str):
-                    data[plaintext_field] = to_plaintext(latex_value)
-                else:
-                    # Non-string values (e.g., None, int) pass through unchanged
-                    data[plaintext_field] = latex_value
-
-        # Recursively clean nested structures
-        for key, value in data.items():
-            data[key] = clean_yaml(value, top_level=False)
+    num_added = _enforce_field_pairs(data)
 
-    elif isinstance(data, list):
-        data = [clean_yaml(item, top_level=False) for item in data]
-
-    # Sort keys at top level only (once at the end)
+    # Sort keys once at the end
     if top_level:
         data = _sort_dict_keys(data)
 
-    # Primitives (str, int, bool, None) pass through unchanged
+    if return_count:
+        return data, num_added
     return data
 
 
-def count_new_fields(original: Any, cleaned: Any, field_pairs: list) -> int:
+def count_new_fields(original: Any, cleaned: Any, field_pairs: Sequence[Tuple[str, str]]) -> int:
     """
     Recursively count how many fields were added during cleaning.
 
+    Needs a pre-cleaning copy of the data; when cleaning with clean_yaml(), prefer
+    clean_yaml(data, return_count=True), which counts during the same pass.
+
     Args:
         original: Original data structure before cleaning
         cleaned: Cleaned data structure after normalization
-        field_pairs: List of (latex_field, plaintext_field) tuples
+        field_pairs: Sequence of (latex_field, plaintext_field) tuples
 
     Returns:
         Number of new fields added
@@ -11,6 +11,10 @@ Note: This module handles content removal only. For formatting normalization
 import re
 from typing import Set
 
+_SUGGEST_OPEN = r"\suggest{"
+_BEGIN_DOCUMENT = r"\begin{document}"
+_BRACE_RE = re.compile(r"[{}]")
+
 
 class CommentType:
     """Enum-like class for comment types"""
@@ -222,11 +226,11 @@ def clean_latex_content(
         Cleaned LaTeX content (comments removed, but not normalized)
     """
     # Check if preamble-aware cleaning is requested
-    match = re.search(r"\\begin\{document\}", content)
+    begin_doc_start = content.find(_BEGIN_DOCUMENT)
 
-    if match and preamble_comment_types is not None:
-        # Split at \begin{document}
-        begin_doc_position = match.end()
+    if begin_doc_start != -1 and preamble_comment_types is not None:
+        # Split after \begin{document}
+        begin_doc_position = begin_doc_start + len(_BEGIN_DOCUMENT)
         preamble = content[:begin_doc_position]
         body = content[begin_doc_position:]
 
@@ -250,7 +254,9 @@ def remove_suggest_blocks_from_content(content: str) -> str:
     """
     Remove all \\suggest{...} blocks from LaTeX content.
 
-    Uses a simple state machine to track brace matching.
+    Jumps between \\suggest{ occurrences with str.find() and only visits brace
+    characters when matching the closing brace. A brace preceded by a backslash
+    is treated as escaped. An unclosed block removes the rest of the content.
 
     Args:
         content: The LaTeX content
@@ -258,25 +264,26 @@ def remove_suggest_blocks_from_content(content: str) -> str:
     Returns:
         Content with \\suggest{...} blocks removed
     """
-    result = []
+    pieces = []
     i = 0
 
-    while i < len(content):
+    while True:
         # Look for \suggest{
-        if content[i : i + 9] == r"\suggest{":
-            # Found a suggest block - skip it and its contents
-            i += 9  # Skip '\suggest{'
-            brace_count = 1
-
-            # Find the matching closing brace
-            while i < len(content) and brace_count > 0:
-                if content[i] == "{" and (i == 0 or content[i - 1] != "\\"):
-                    brace_count += 1
-                elif content[i] == "}" and (i == 0 or content[i - 1] != "\\"):
-                    brace_count -= 1
-                i += 1
-        else:
-            result.append(content[i])
-            i += 1
-
-    return "".join(result)
+        start = content.find(_SUGGEST_OPEN, i)
+        if start == -1:
+            pieces.append(content[i:])
+            break
+        pieces.append(content[i:start])
+
+        # Find the matching closing brace (unclosed block swallows the rest)
+        i = len(content)
+        brace_count = 1
+        for match in _BRACE_RE.finditer(content, start + len(_SUGGEST_OPEN)):
+            if content[match.start() - 1] == "\\":
+                continue
+            brace_count += 1 if match.group() == "{" else -1
+            if brace_count == 0:
+                i = match.end()
+                break
+
+    return "".join(pieces)
@@ -9,6 +9,7 @@ All LaTeX patterns are defined as constants below for visibility and maintainabi
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 
 from archer.utils.text_processing import extract_balanced_delimiters
@@ -55,6 +56,11 @@ class LaTeXPatterns:
     ANY_COMMAND_NO_BRACES: str = r"\\[a-zA-Z]+"  # Matches any \command
 
 
+# Argument openers (compiled once; matched in place with pattern.match(text, pos))
+_OPTIONAL_ARG_START_RE = re.compile(r"\s*\[")
+_SPECIAL_PAREN_START_RE = re.compile(r"\s*\(")
+
+
 # Used only twice, might not be useful. Might replace it with other, more general function(s)
 def extract_brace_arguments(latex_str: str) -> List[str]:
     """
@@ -97,37 +103,70 @@ def extract_sequential_params(latex_str: str, start_pos: int, num_params: int) -
         >>> extract_sequential_params(latex, 23, 4)  # Start after {itemizeAcademic}
         ['Company', 'Title {with \\textit{nested}}', 'Location', 'Dates']
     """
+    params, _ = _scan_sequential_params(latex_str, start_pos, num_params)
+    return params
+
+
+def _scan_sequential_params(
+    latex_str: str, start_pos: int, num_params: int
+) -> Tuple[List[str], int]:
+    """
+    Extract up to N sequential {...} parameters and report where scanning stopped.
+
+    Returns:
+        (params, end_pos) where end_pos is just past the last extracted parameter
+        (start_pos if none were found; an unmatched brace stops the scan there)
+    """
     params = []
-    pos = start_pos
+    end_pos = start_pos
 
     for _ in range(num_params):
-        # Find opening brace
-        while pos < len(latex_str) and latex_str[pos] != "{":
-            pos += 1
+        # Jump to opening brace
+        brace_pos = latex_str.find("{", end_pos)
+        if brace_pos == -1:
+            break
 
-        if pos >= len(latex_str):
+        # Match closing brace (skips escaped chars, handles nesting)
+        try:
+            param_value, end_pos = extract_balanced_delimiters(latex_str, brace_pos + 1)
+        except ValueError:
+            # Unmatched brace: keep end_pos at the last complete parameter
             break
 
-        # Count braces to find matching close
-        pos += 1  # Skip opening brace
-        brace_count = 1
-        param_start = pos
-
-        while pos < len(latex_str) and brace_count > 0:
-            if latex_str[pos] == "\\":
-                pos += 2  # Skip escaped char
-                continue
-            elif latex_str[pos] == "{":
-                brace_count += 1
-            elif latex_str[pos] == "}":
-                brace_count -= 1
-            pos += 1
-
-        if brace_count == 0:
-            param_value = latex_str[param_start : pos - 1]
-            params.append(param_value)
+        params.append(param_value)
 
-    return params
+    return params, end_pos
+
+
+def _skip_balanced(text: str, pos: int, open_char: str, close_char: str) -> int:
+    """
+    Return the position just past the delimiter closing the group opened before pos.
+
+    Unmatched groups consume the rest of the text (returns len(text)).
+    """
+    try:
+        _, end_pos = extract_balanced_delimiters(text, pos, open_char, close_char)
+    except ValueError:
+        return len(text)
+    return end_pos
+
+
+@lru_cache(maxsize=None)
+def _environment_regexes(env_name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the \\begin{env} pattern and the combined \\begin/\\end token pattern for env_name.
+
+    Parse configs only use a handful of environment names, so both patterns are
+    built once per name rather than on every extract_environment_content() call.
+    """
+    # Escape special regex characters in env_name (e.g., * in textblock*)
+    env_name_escaped = re.escape(env_name)
+
+    # Build patterns from templates
+    begin_pattern = LaTeXPatterns.BEGIN_ENV.format(env=env_name_escaped)
+    end_pattern = LaTeXPatterns.END_ENV.format(env=env_name_escaped)
+
+    return re.compile(begin_pattern), re.compile(f"(?P<begin>{begin_pattern})|{end_pattern}")
 
 
 def extract_environment_content(
@@ -161,51 +200,39 @@ def extract_environment_content(
         >>> content
         ' foo \\\\begin{itemize} bar \\\\end{itemize} '
     """
-    # Escape special regex characters in env_name (e.g., * in textblock*)
-    env_name_escaped = re.escape(env_name)
-
-    # Build patterns from templates
-    begin_pattern = LaTeXPatterns.BEGIN_ENV.format(env=env_name_escaped)
-    end_pattern = LaTeXPatterns.END_ENV.format(env=env_name_escaped)
+    begin_regex, token_regex = _environment_regexes(env_name)
 
     # Find \begin{env_name}
-    begin_match = re.search(begin_pattern, text[start_pos:])
+    begin_match = begin_regex.search(text, start_pos)
 
     if not begin_match:
         raise ValueError(f"No \\begin{{{env_name}}} found")
 
-    begin_end_pos = start_pos + begin_match.end()
+    begin_end_pos = begin_match.end()
 
     # Count nested environments to find matching \end{env_name}
-    pos = begin_end_pos
+    # Single left-to-right pass over \begin/\end tokens (no rescans of the remainder)
     depth = 1
 
-    while pos < len(text) and depth > 0:
-        begin_nested = re.search(begin_pattern, text[pos:])
-        end_nested = re.search(end_pattern, text[pos:])
-
-        if end_nested:
-            if begin_nested and begin_nested.start() < end_nested.start():
-                # Found nested \begin before \end
-                depth += 1
-                pos += begin_nested.end()
+    for token in token_regex.finditer(text, begin_end_pos):
+        if token.lastgroup == "begin":
+            # Found nested \begin before \end
+            depth += 1
+            continue
+
+        # Found \end
+        depth -= 1
+        if depth == 0:
+            # Adjust begin position if requested to include \begin command
+            if include_env_command_in_positions:
+                begin_pos_to_return = begin_match.start()
+                end_pos_to_return = token.end()
             else:
-                # Found \end
-                depth -= 1
-                if depth == 0:
-                    # Adjust begin position if requested to include \begin command
-                    if include_env_command_in_positions:
-                        begin_pos_to_return = start_pos + begin_match.start()
-                        end_pos_to_return = pos + end_nested.end()
-                    else:
-                        begin_pos_to_return = begin_end_pos
-                        end_pos_to_return = pos + end_nested.start()
-
-                    content = text[begin_pos_to_return:end_pos_to_return]
-                    return content, begin_pos_to_return, end_pos_to_return
-                pos += end_nested.end()
-        else:
-            break
+                begin_pos_to_return = begin_end_pos
+                end_pos_to_return = token.start()
+
+            content = text[begin_pos_to_return:end_pos_to_return]
+            return content, begin_pos_to_return, end_pos_to_return
 
     raise ValueError(f"Unmatched \\begin{{{env_name}}}")
 
@@ -281,41 +308,33 @@ def extract_environment(
     content = raw_env_content
 
     if num_optional_params > 0 or num_params > 0:
-        # Use skip_latex_arguments to extract and skip both optional and mandatory params
-        content = skip_latex_arguments(
-            raw_env_content, optional=num_optional_params, mandatory=num_params
-        )
-
         # Extract optional params
         pos = 0
         for _ in range(num_optional_params):
             # Find opening [
-            match = re.match(r"\s*\[", raw_env_content[pos:])
+            match = _OPTIONAL_ARG_START_RE.match(raw_env_content, pos)
             if not match:
                 break
-            pos += match.end()
 
             # Find matching ]
-            bracket_count = 1
-            param_start = pos
-            while pos < len(raw_env_content) and bracket_count > 0:
-                if raw_env_content[pos] == "\\":
-                    pos += 2  # Skip escaped char
-                    continue
-                elif raw_env_content[pos] == "[":
-                    bracket_count += 1
-                elif raw_env_content[pos] == "]":
-                    bracket_count -= 1
-                pos += 1
-
-            if bracket_count == 0:
-                params.append(raw_env_content[param_start : pos - 1])
-
-        # Extract mandatory params
+            try:
+                param_value, pos = extract_balanced_delimiters(
+                    raw_env_content, match.end(), "[", "]"
+                )
+            except ValueError:
+                pos = len(raw_env_content)
+                break
+
+            params.append(param_value)
+
+        # Extract mandatory params, continuing from where the optional params ended
         if num_params > 0:
-            mandatory_params = extract_sequential_params(raw_env_content, pos, num_params)
+            mandatory_params, pos = _scan_sequential_params(raw_env_content, pos, num_params)
             params.extend(mandatory_params)
 
+        # Content starts right after the last parameter (header is walked only once)
+        content = raw_env_content[pos:].lstrip()
+
     return params, content, begin_end_pos, end_start_pos
 
 
@@ -340,6 +359,7 @@ def extract_all_environments(
     begin_pattern = LaTeXPatterns.BEGIN_ENV_PATTERN.format(pattern=env_pattern)
 
     results = []
+    append = results.append  # Bound once; called per environment
     for match in re.finditer(begin_pattern, text):
         env_name = match.group(1)  # Captured environment name
         params, content, begin_end_pos, end_start_pos = extract_environment(
@@ -349,7 +369,7 @@ def extract_all_environments(
             start_pos=match.start(),
             include_env_command_in_positions=include_env_command_in_positions,
         )
-        results.append((env_name, params, content, begin_end_pos, end_start_pos))
+        append((env_name, params, content, begin_end_pos, end_start_pos))
     return results
 
 
@@ -438,20 +458,19 @@ def split_itemize_entries(content: str, marker_pattern: str) -> List[str]:
         ['\\itemi First', '\\itemi Second', '\\itemi Third']
     """
     # Find all marker positions
-    matches = list(re.finditer(marker_pattern, content))
+    starts = [match.start() for match in re.finditer(marker_pattern, content)]
 
-    if not matches:
+    if not starts:
         return []
 
     entries = []
-    for i, match in enumerate(matches):
-        start = match.start()
-        # End is either next marker start or end of content
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+    append = entries.append  # Bound once; called per entry
 
+    # End is either next marker start or end of content
+    for start, end in zip(starts, starts[1:] + [len(content)]):
         entry = content[start:end].strip()
         if entry:  # Skip empty entries
-            entries.append(entry)
+            append(entry)
 
     return entries
 
@@ -460,7 +479,8 @@ def parse_itemize_content(content: str, marker_pattern: str) -> List[dict]:
     """
     Parse itemize content into list of entry dictionaries.
 
-    Convenience function that combines split_itemize_entries + extract_itemize_entry.
+    Equivalent to split_itemize_entries + extract_itemize_entry, but reuses each
+    marker match from the split instead of matching every entry a second time.
     Use when you already have the environment content extracted.
 
     Args:
@@ -478,8 +498,32 @@ def parse_itemize_content(content: str, marker_pattern: str) -> List[dict]:
         >>> entries[1]
         {'marker': 'itemi', 'latex_raw': 'Second', 'plaintext': 'Second'}
     """
-    entry_strs = split_itemize_entries(content, marker_pattern)
-    return [extract_itemize_entry(e, marker_pattern) for e in entry_strs]
+    # Single finditer pass: each marker match already gives the marker and where its text
+    # starts, so entries are not re-matched one by one after splitting
+    matches = list(re.finditer(marker_pattern, content))
+
+    entries = []
+    append = entries.append  # Bound once; called per entry
+
+    for match, end in zip(matches, [m.start() for m in matches[1:]] + [len(content)]):
+        entry = content[match.start() : end].rstrip()
+        if not entry:
+            continue
+        if match.end() >= match.start() + len(entry):
+            # Marker runs into trailing whitespace (no item text) - let the
+            # per-entry matcher decide on the stripped entry
+            append(extract_itemize_entry(entry, marker_pattern))
+            continue
+        latex_raw = content[match.end() : end].strip()
+        append(
+            {
+                "marker": match.group("marker"),
+                "latex_raw": latex_raw,
+                "plaintext": to_plaintext(latex_raw),
+            }
+        )
+
+    return entries
 
 
 def parse_itemize_with_complex_markers(content: str, marker_pattern: str) -> List[dict]:
@@ -511,8 +555,10 @@ def parse_itemize_with_complex_markers(content: str, marker_pattern: str) -> Lis
         'GPU-hours'
     """
     items = []
+    append = items.append  # Bound once; called per item
+    marker_regex = re.compile(marker_pattern)
 
-    for match in re.finditer(marker_pattern, content):
+    for match in marker_regex.finditer(content):
         item_pos = match.end()
 
         # Check if this is \item[...] (with bracket)
@@ -532,16 +578,16 @@ def parse_itemize_with_complex_markers(content: str, marker_pattern: str) -> Lis
             marker = "\\item"
 
         # Find start of next \item or end of content
-        next_item = re.search(marker_pattern, content[item_pos:])
+        next_item = marker_regex.search(content, item_pos)
         if next_item:
-            content_end = item_pos + next_item.start()
+            content_end = next_item.start()
         else:
             content_end = len(content)
 
         # Extract item content
         item_content = content[item_pos:content_end].strip()
 
-        items.append(
+        append(
             {"marker": marker, "latex_raw": item_content, "plaintext": to_plaintext(item_content)}
         )
 
@@ -575,10 +621,12 @@ def replace_command(text: str, command: str, prefix: str = "", suffix: str = "")
     """
     result = text
     command_pattern = f"\\{command}{{"
+    search_from = 0
 
     while True:
-        # Find next occurrence of \command{
-        pos = result.find(command_pattern)
+        # Find next occurrence of \command{ (text before the last replacement point
+        # is unchanged, so only rescan from where a new occurrence could start)
+        pos = result.find(command_pattern, search_from)
         if pos == -1:
             break
 
@@ -591,6 +639,7 @@ def replace_command(text: str, command: str, prefix: str = "", suffix: str = "")
 
             # Replace \command{content} with prefix + content + suffix
             result = result[:pos] + prefix + content + suffix + result[end_pos:]
+            search_from = max(0, pos - len(command_pattern) + 1)
         except ValueError:
             # Unmatched braces, skip this occurrence
             break
@@ -598,6 +647,18 @@ def replace_command(text: str, command: str, prefix: str = "", suffix: str = "")
     return result
 
 
+@lru_cache(maxsize=None)
+def _command_regex(template: str, command: str) -> re.Pattern:
+    """
+    Compile a LaTeXPatterns command template for one command name.
+
+    Command names come from small fixed lists, so each template/command pair is
+    escaped and compiled once instead of on every call.
+    """
+    # Escape special regex characters in the command name
+    return re.compile(template.format(command=re.escape(command)))
+
+
 def strip_formatting(text: str, commands: List[str]) -> str:
     """
     Remove LaTeX formatting commands from text.
@@ -620,9 +681,7 @@ def strip_formatting(text: str, commands: List[str]) -> str:
     """
     result = text
     for command in commands:
-        # Build pattern from template, escaping command name
-        pattern = LaTeXPatterns.COMMAND_WITH_WHITESPACE.format(command=re.escape(command))
-        result = re.sub(pattern, "", result)
+        result = _command_regex(LaTeXPatterns.COMMAND_WITH_WHITESPACE, command).sub("", result)
     return result
 
 
@@ -643,11 +702,12 @@ def remove_command_at_end(text: str, command: str) -> str:
         >>> remove_command_at_end("Some text", "par")
         'Some text'
     """
-    # Build pattern from template, escaping command name
-    pattern = LaTeXPatterns.COMMAND_AT_END.format(command=re.escape(command))
-    return re.sub(pattern, "", text)
+    return _command_regex(LaTeXPatterns.COMMAND_AT_END, command).sub("", text)
 
 
+# Pure str -> str and the dominant cost of parsing; bullets, skills and metadata
+# repeat across sections, documents and roundtrip passes
+@lru_cache(maxsize=4096)
 def to_plaintext(latex_str: str, strip_latex_params: bool = True) -> str:
     """
     Strip ALL LaTeX commands from text, returning pure plaintext.
@@ -792,6 +852,9 @@ def to_plaintext(latex_str: str, strip_latex_params: bool = True) -> str:
     return result
 
 
+# Pure str -> str; clean_yaml re-escapes the same names, skills and headers
+# across every field and variant
+@lru_cache(maxsize=4096)
 def to_latex(plaintext_str: str) -> str:
     """
     Convert plaintext to LaTeX by escaping special characters.
@@ -884,62 +947,25 @@ def skip_latex_arguments(
     # Skip optional arguments [...]
     for _ in range(optional):
         # Find opening [
-        match = re.match(r"\s*\[", text[pos:])
+        match = _OPTIONAL_ARG_START_RE.match(text, pos)
         if not match:
             break
-        pos += match.end()
 
         # Find matching ]
-        bracket_count = 1
-        while pos < len(text) and bracket_count > 0:
-            if text[pos] == "\\":
-                pos += 2  # Skip escaped char
-                continue
-            elif text[pos] == "[":
-                bracket_count += 1
-            elif text[pos] == "]":
-                bracket_count -= 1
-            pos += 1
+        pos = _skip_balanced(text, match.end(), "[", "]")
 
     # Skip mandatory arguments {...} (with nesting support)
     if mandatory > 0:
-        params = extract_sequential_params(text, pos, mandatory)
-        # Calculate how many chars to skip (all the {...} blocks)
-        for _ in params:
-            # Skip whitespace before {
-            match = re.match(r"\s*", text[pos:])
-            pos += match.end()
-            # Skip the {...} block
-            brace_count = 1
-            pos += 1  # Skip opening {
-            while pos < len(text) and brace_count > 0:
-                if text[pos] == "\\":
-                    pos += 2
-                    continue
-                elif text[pos] == "{":
-                    brace_count += 1
-                elif text[pos] == "}":
-                    brace_count -= 1
-                pos += 1
+        # The scan reports where the last {...} block ended, so the blocks are walked once
+        _, pos = _scan_sequential_params(text, pos, mandatory)
 
     # Skip special paren argument (...)
     if special_paren:
         # Find opening (
-        match = re.match(r"\s*\(", text[pos:])
+        match = _SPECIAL_PAREN_START_RE.match(text, pos)
         if match:
-            pos += match.end()
-
             # Find matching )
-            paren_count = 1
-            while pos < len(text) and paren_count > 0:
-                if text[pos] == "\\":
-                    pos += 2  # Skip escaped char
-                    continue
-                elif text[pos] == "(":
-                    paren_count += 1
-                elif text[pos] == ")":
-                    paren_count -= 1
-                pos += 1
+            pos = _skip_balanced(text, match.end(), "(", ")")
 
     return text[pos:].lstrip()
 
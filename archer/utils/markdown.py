@@ -20,9 +20,11 @@ def _remove_href_keep_text(text: str) -> str:
     Handles nested braces in the text argument using balanced delimiter matching.
     """
     result = text
+    search_from = 0
 
     while True:
-        pos = result.find(r"\href{")
+        # Text before the last replacement point is unchanged, so resume the search there
+        pos = result.find(r"\href{", search_from)
         if pos == -1:
             break
 
@@ -46,6 +48,7 @@ def _remove_href_keep_text(text: str) -> str:
 
             # Replace entire \href{url}{text} with just display_text
             result = result[:pos] + display_text + result[text_end:]
+            search_from = max(0, pos - 5)
         except ValueError:
             break
 
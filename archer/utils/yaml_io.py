@@ -0,0 +1,181 @@
+"""
+YAML file I/O.
+
+Plain-container YAML loading and saving through PyYAML's libyaml bindings when
+available. OmegaConf is only used for files that actually contain interpolations.
+Plain scalars resolve the way OmegaConf resolves them, so switching loaders does
+not change the types callers see.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+from omegaconf import OmegaConf
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure-Python otherwise
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_BaseSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_FLOAT_TAG = "tag:yaml.org,2002:float"
+_TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
+
+# OmegaConf's float pattern: unlike YAML 1.1 it accepts exponents without a dot (1e3)
+_OMEGACONF_FLOAT_RE = re.compile(
+    r"""^(?:
+     [-+]?[0-9]+(?:_[0-9]+)*\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?:[eE][-+]?[0-9]+)
+    |\.[0-9]+(?:_[0-9]+)*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9]+(?:_[0-9]+)*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN))$""",
+    re.X,
+)
+_FLOAT_FIRST_CHARS = list("-+0123456789.")
+
+
+class YAMLSafeLoader(_BaseSafeLoader):
+    """
+    Safe loader that resolves plain scalars like OmegaConf.load().
+
+    Dates and timestamps stay strings (no timestamp resolver), and exponent
+    floats without a dot such as 1e3 load as floats.
+    """
+
+
+YAMLSafeLoader.add_implicit_resolver(_FLOAT_TAG, _OMEGACONF_FLOAT_RE, _FLOAT_FIRST_CHARS)
+YAMLSafeLoader.yaml_implicit_resolvers = {
+    first_char: [(tag, regexp) for tag, regexp in resolvers if tag != _TIMESTAMP_TAG]
+    for first_char, resolvers in YAMLSafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+class YAMLSafeDumper(_BaseSafeDumper):
+    """
+    Safe dumper that quotes strings YAMLSafeLoader would read back as floats.
+
+    Like OmegaConf.save(), a string such as '1e3' is written quoted. Date-like
+    strings are already quoted by the default timestamp resolver.
+    """
+
+
+YAMLSafeDumper.add_implicit_resolver(_FLOAT_TAG, _OMEGACONF_FLOAT_RE, _FLOAT_FIRST_CHARS)
+
+# OmegaConf interpolation marker. Project YAML rarely uses interpolation,
+# so plain PyYAML is used unless this marker appears in the file.
+OMEGACONF_INTERPOLATION_MARKER = "${"
+
+
+def load_yaml(yaml_path: Path) -> Any:
+    """
+    Load a YAML file into plain Python containers.
+
+    Uses PyYAML directly, falling back to OmegaConf only when the file contains
+    interpolations that need resolving.
+
+    Args:
+        yaml_path: Path to YAML file
+
+    Returns:
+        Parsed YAML as nested dicts/lists
+    """
+    text = Path(yaml_path).read_text(encoding="utf-8")
+    if OMEGACONF_INTERPOLATION_MARKER in text:
+        return OmegaConf.to_container(OmegaConf.create(text), resolve=True)
+    return yaml.load(text, Loader=YAMLSafeLoader)
+
+
+def _copy_yaml_tree(data: Any) -> Any:
+    """
+    Copy a loaded YAML tree of dicts and lists.
+
+    Loaded YAML is a tree whose leaves are immutable scalars, so this skips
+    copy.deepcopy's memo bookkeeping and per-type dispatch. Walks the tree with an
+    explicit stack rather than recursion, so deeply nested YAML cannot hit the
+    recursion limit.
+    """
+    if isinstance(data, dict):
+        root = {}
+    elif isinstance(data, list):
+        root = [None] * len(data)
+    else:
+        return data
+
+    stack = [(data, root)]
+    while stack:
+        source, target = stack.pop()
+        # Lists are preallocated, so both container types fill by key/index
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, dict):
+                child = {}
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child = [None] * len(value)
+                stack.append((value, child))
+            else:
+                child = value
+            target[key] = child
+
+    return root
+
+
+@lru_cache(maxsize=256)
+def _load_yaml_snapshot(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size); callers must not mutate the result."""
+    return load_yaml(Path(path_str))
+
+
+def load_yaml_cached(yaml_path: Path) -> Any:
+    """
+    Load a YAML file, reusing the parse from an earlier call if the file is unchanged.
+
+    Roundtrip validation loads the same intermediate YAML for generation and again
+    for comparison. The cache is keyed by path, mtime and size, so rewriting the
+    file invalidates it. A deep copy is returned because consumers mutate the
+    loaded containers (e.g. clean_yaml).
+
+    Args:
+        yaml_path: Path to YAML file
+
+    Returns:
+        Parsed YAML as nested dicts/lists (a fresh copy owned by the caller)
+    """
+    path = Path(yaml_path)
+    stat = path.stat()
+    return _copy_yaml_tree(_load_yaml_snapshot(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+# Matches OmegaConf.save() formatting (insertion order, block style, unicode)
+_DUMP_OPTIONS = {"sort_keys": False, "allow_unicode": True, "default_flow_style": False}
+
+
+def dump_yaml(data: Any) -> str:
+    """
+    Serialize plain Python containers to a YAML string.
+
+    Uses the same formatting as save_yaml().
+
+    Args:
+        data: Data to serialize
+
+    Returns:
+        YAML text
+    """
+    return yaml.dump(data, Dumper=YAMLSafeDumper, **_DUMP_OPTIONS)
+
+
+def save_yaml(data: Any, output_path: Path) -> None:
+    """
+    Write plain Python containers to a YAML file.
+
+    Output matches OmegaConf.save() formatting (insertion order, block style, unicode).
+
+    Args:
+        data: Data to serialize
+        output_path: Destination path
+    """
+    with Path(output_path).open("w", encoding="utf-8") as f:
+        yaml.dump(data, f, Dumper=YAMLSafeDumper, **_DUMP_OPTIONS)
@@ -36,6 +36,7 @@ from typing_extensions import Annotated
 
 from archer.contexts.templating import apply_presets
 from archer.utils.resume_registry import get_resume_file
+from archer.utils.yaml_io import dump_yaml, load_yaml
 
 load_dotenv()
 RESUME_PRESETS_PATH = Path(os.getenv("RESUME_PRESETS_PATH"))
@@ -78,7 +79,7 @@ def options_command(
 
         $ apply_presets.py options colors     # Only color presets
     """
-    nested = OmegaConf.to_container(OmegaConf.load(RESUME_PRESETS_PATH), resolve=True)
+    nested = load_yaml(RESUME_PRESETS_PATH)
 
     if category:
         if category not in nested:
@@ -188,7 +189,7 @@ def apply_command(
 
     # Load YAML
     typer.echo(f"Loading: {yaml_path}")
-    yaml_data = OmegaConf.to_container(OmegaConf.load(yaml_path), resolve=True)
+    yaml_data = load_yaml(yaml_path)
     original_data = copy.deepcopy(yaml_data) if verbose else None
 
     # Apply presets
@@ -206,13 +207,8 @@ def apply_command(
     # Determine output path
     output_path = output if output else yaml_path
 
-    # Save modified YAML
-    conf = OmegaConf.create(modified_data)
-    OmegaConf.save(conf, output_path)
-
-    # Strip trailing blank lines for consistency
-    content = output_path.read_text()
-    output_path.write_text(content.rstrip() + "\n")
+    # Save modified YAML, stripping trailing blank lines for consistency
+    output_path.write_text(dump_yaml(modified_data).rstrip() + "\n", encoding="utf-8")
 
     typer.secho("✓ Presets applied successfully", fg=typer.colors.GREEN, bold=True)
     typer.echo(f"  Output: {output_path}")
@@ -15,7 +15,6 @@ from pathlib import Path
 
 import typer
 from dotenv import load_dotenv
-from omegaconf import OmegaConf
 
 from archer.contexts.templating import (
     clean_yaml,
@@ -24,6 +23,7 @@ from archer.contexts.templating import (
     validate_roundtrip_conversion,
 )
 from archer.utils.timestamp import now
+from archer.utils.yaml_io import dump_yaml, load_yaml
 
 load_dotenv()
 PROJECT_ROOT = Path(os.getenv("PROJECT_ROOT"))
@@ -156,8 +156,7 @@ def clean_command(
 
     try:
         # Load YAML
-        yaml_data = OmegaConf.load(yaml_file)
-        yaml_dict = OmegaConf.to_container(yaml_data, resolve=True)
+        yaml_dict = load_yaml(yaml_file)
 
         # Clean YAML and count changes
         cleaned_dict, changes = clean_yaml(yaml_dict, return_count=True)
@@ -165,13 +164,8 @@ def clean_command(
         typer.echo(f"Fields normalized: {changes}")
 
         if not dry_run:
-            # Save cleaned YAML
-            conf = OmegaConf.create(cleaned_dict)
-            OmegaConf.save(conf, output_path)
-
-            # Strip trailing blank lines for consistency
-            content = output_path.read_text()
-            output_path.write_text(content.rstrip() + "\n")
+            # Save cleaned YAML, stripping trailing blank lines for consistency
+            output_path.write_text(dump_yaml(cleaned_dict).rstrip() + "\n", encoding="utf-8")
 
             typer.secho(f"\n✓ Success! Cleaned YAML saved to: {output_path}", fg=typer.colors.GREEN)
         else:
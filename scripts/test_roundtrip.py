@@ -18,7 +18,7 @@ from pathlib import Path
 import typer
 from dotenv import load_dotenv
 
-from archer.contexts.templating import validate_roundtrip_conversion
+from archer.contexts.templating import validate_roundtrip_batch, validate_roundtrip_conversion
 from archer.utils.timestamp import now
 
 load_dotenv()
@@ -30,6 +30,22 @@ RESUME_ARCHIVE_PATH = Path(os.getenv("RESUME_ARCHIVE_PATH"))
 DEFAULT_MAX_LATEX_DIFFS = 6
 DEFAULT_MAX_YAML_DIFFS = 0
 
+
+def roundtrip_diffs(roundtrip: dict) -> str:
+    """Diff count of one roundtrip result, or 'SKIPPED' if it never ran."""
+    return "SKIPPED" if roundtrip.get("skipped") else str(roundtrip["num_diffs"])
+
+
+def format_roundtrip(
+    roundtrip: dict, pass_label: str = "PASS", fail_label: str = "FAIL", unit: str = " diffs"
+) -> str:
+    """Format one roundtrip result as e.g. 'PASS (3 diffs)', or 'SKIPPED' if it never ran."""
+    if roundtrip.get("skipped"):
+        return "SKIPPED"
+    label = pass_label if roundtrip["success"] else fail_label
+    return f"{label} ({roundtrip_diffs(roundtrip)}{unit})"
+
+
 app = typer.Typer(
     help="Test LaTeX ↔ YAML roundtrip conversion with validation",
     invoke_without_command=True,
@@ -132,21 +148,12 @@ def test_command(
                 typer.echo(f"Artifacts saved to: {work_dir}")
                 raise typer.Exit(code=1)
 
-            latex_status = "✓" if result["latex_roundtrip"]["success"] else "✗"
-            yaml_status = "✓" if result["yaml_roundtrip"]["success"] else "✗"
-            latex_diffs = result["latex_roundtrip"]["num_diffs"]
-            yaml_diffs = result["yaml_roundtrip"]["num_diffs"]
-
-            log.write(
-                f"LaTeX roundtrip: {'PASS' if result['latex_roundtrip']['success'] else 'FAIL'} ({latex_diffs} diffs)\n"
-            )
-            log.write(
-                f"YAML roundtrip:  {'PASS' if result['yaml_roundtrip']['success'] else 'FAIL'} ({yaml_diffs} diffs)\n"
-            )
+            log.write(f"LaTeX roundtrip: {format_roundtrip(result['latex_roundtrip'])}\n")
+            log.write(f"YAML roundtrip:  {format_roundtrip(result['yaml_roundtrip'])}\n")
             log.write(f"Time: {result['time_ms']:.0f}ms\n")
 
-            typer.echo(f"LaTeX roundtrip: {latex_status} ({latex_diffs} diffs)")
-            typer.echo(f"YAML roundtrip:  {yaml_status} ({yaml_diffs} diffs)")
+            typer.echo(f"LaTeX roundtrip: {format_roundtrip(result['latex_roundtrip'], '✓', '✗')}")
+            typer.echo(f"YAML roundtrip:  {format_roundtrip(result['yaml_roundtrip'], '✓', '✗')}")
             typer.echo(f"Time: {result['time_ms']:.0f}ms")
 
             if result["validation_passed"]:
@@ -223,6 +230,19 @@ def batch_command(
         "-k",
         help="Keep all intermediate files even on perfect roundtrip (for inspection)",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of files to validate in parallel worker processes (default: 1, sequential)",
+        min=1,
+    ),
+    fail_fast: bool = typer.Option(
+        False,
+        "--fail-fast",
+        "-f",
+        help="Skip a file's second roundtrip once its first has failed (faster, fewer diff counts)",
+    ),
 ):
     """
     Test roundtrip conversion on all matching resumes.
@@ -239,6 +259,10 @@ def batch_command(
         $ test_roundtrip.py batch -l 0 -y 0                 # Strict validation
 
         $ test_roundtrip.py batch -q                        # Quiet mode
+
+        $ test_roundtrip.py batch -w 4                      # Validate 4 files in parallel
+
+        $ test_roundtrip.py batch -f                        # Stop each file at its first failure
     """
     # Find matching files
     tex_files = sorted(RESUME_ARCHIVE_PATH.glob(pattern))
@@ -276,17 +300,25 @@ def batch_command(
         results = []
 
         try:
+            # Results arrive in input order; with -w 1 each file is validated on request
+            batch_results = validate_roundtrip_batch(
+                tex_files,
+                log_dir,
+                max_latex_diffs,
+                max_yaml_diffs,
+                workers=workers,
+                fail_fast=fail_fast,
+            )
             for i, tex_file in enumerate(tex_files, 1):
+                # Announce the file before waiting on its result so progress shows what is running
                 if not quiet:
                     print(f"[{i}/{len(tex_files)}] {tex_file.name}...", end=" ", flush=True)
+                result = next(batch_results)
 
                 log.write(f"[{i}/{len(tex_files)}] {tex_file.name}\n")
 
                 # Each file gets its own subdirectory
                 work_dir = log_dir / tex_file.stem
-                result = validate_roundtrip_conversion(
-                    tex_file, work_dir, max_latex_diffs, max_yaml_diffs
-                )
                 results.append(result)
 
                 if result["error"]:
@@ -294,15 +326,8 @@ def batch_command(
                         typer.secho(f"✗ ERROR: {result['error']}", fg=typer.colors.RED)
                     log.write(f"  ERROR: {result['error']}\n\n")
                 else:
-                    latex_status = "PASS" if result["latex_roundtrip"]["success"] else "FAIL"
-                    yaml_status = "PASS" if result["yaml_roundtrip"]["success"] else "FAIL"
-
-                    log.write(
-                        f"  LaTeX: {latex_status} ({result['latex_roundtrip']['num_diffs']} diffs)\n"
-                    )
-                    log.write(
-                        f"  YAML: {yaml_status} ({result['yaml_roundtrip']['num_diffs']} diffs)\n"
-                    )
+                    log.write(f"  LaTeX: {format_roundtrip(result['latex_roundtrip'])}\n")
+                    log.write(f"  YAML: {format_roundtrip(result['yaml_roundtrip'])}\n")
                     log.write(f"  Time: {result['time_ms']:.0f}ms\n")
 
                     if result["validation_passed"]:
@@ -328,8 +353,8 @@ def batch_command(
                     else:
                         if not quiet:
                             typer.secho(
-                                f"✗ LaTeX:{result['latex_roundtrip']['num_diffs']} "
-                                f"YAML:{result['yaml_roundtrip']['num_diffs']}",
+                                f"✗ LaTeX:{roundtrip_diffs(result['latex_roundtrip'])} "
+                                f"YAML:{roundtrip_diffs(result['yaml_roundtrip'])}",
                                 fg=typer.colors.RED,
                             )
                         log.write("  Validation: FAILED - artifacts kept\n\n")
@@ -352,6 +377,9 @@ def batch_command(
     )
     total = len(results)
 
+    # Roundtrips skipped by --fail-fast never ran, so they add no diffs
+    roundtrips = [r[key] for r in results for key in ("latex_roundtrip", "yaml_roundtrip")]
+    skipped = sum(1 for roundtrip in roundtrips if roundtrip.get("skipped"))
     total_latex_diffs = sum(
         r["latex_roundtrip"]["num_diffs"]
         for r in results
@@ -372,6 +400,8 @@ def batch_command(
         typer.echo(f"  Failed:                {failed}/{total}")
         typer.echo(f"  Total LaTeX diffs:     {total_latex_diffs:,}")
         typer.echo(f"  Total YAML diffs:      {total_yaml_diffs:,}")
+        if skipped:
+            typer.echo(f"  Skipped roundtrips:    {skipped} (--fail-fast)")
         typer.echo(f"  Errors:                {errors}")
 
     # Save summary.txt
@@ -385,6 +415,8 @@ def batch_command(
         f.write(f"Failed:                {failed}/{total}\n")
         f.write(f"Total LaTeX diffs:     {total_latex_diffs:,}\n")
         f.write(f"Total YAML diffs:      {total_yaml_diffs:,}\n")
+        if skipped:
+            f.write(f"Skipped roundtrips:    {skipped} (--fail-fast)\n")
         f.write(f"Errors:                {errors}\n\n")
 
         # Find longest filename for alignment
@@ -398,16 +430,8 @@ def batch_command(
                 f.write(f"{r['file']}{padding}: ERROR - {r['error']}\n")
             else:
                 # Always show diff counts, even when passing
-                latex_str = (
-                    f"PASS ({r['latex_roundtrip']['num_diffs']})"
-                    if r["latex_roundtrip"]["success"]
-                    else f"FAIL ({r['latex_roundtrip']['num_diffs']})"
-                )
-                yaml_str = (
-                    f"PASS ({r['yaml_roundtrip']['num_diffs']})"
-                    if r["yaml_roundtrip"]["success"]
-                    else f"FAIL ({r['yaml_roundtrip']['num_diffs']})"
-                )
+                latex_str = format_roundtrip(r["latex_roundtrip"], unit="")
+                yaml_str = format_roundtrip(r["yaml_roundtrip"], unit="")
                 status = "PASS" if r["validation_passed"] else "FAIL"
                 f.write(f"{r['file']}{padding}: {status} - LaTeX={latex_str} YAML={yaml_str}\n")
 
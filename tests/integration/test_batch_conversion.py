@@ -0,0 +1,74 @@
+"""
+Integration tests for batch conversion helpers.
+Tests: batch results match one-at-a-time conversion, in input order.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+from archer.contexts.templating.converter import (
+    validate_roundtrip_batch,
+    validate_roundtrip_conversion,
+    yaml_to_latex,
+    yaml_to_latex_batch,
+)
+
+load_dotenv()
+FIXTURES_PATH = Path(os.getenv("RESUME_ARCHIVE_PATH")) / "fixtures"
+STRUCTURED_PATH = Path(os.getenv("RESUME_ARCHIVE_PATH")) / "structured"
+
+
+def _without_timing(result):
+    return {key: value for key, value in result.items() if key != "time_ms"}
+
+
+@pytest.mark.integration
+def test_validate_roundtrip_batch_sequential(tmp_path):
+    """Test that in-process batch validation matches per-file validation, in input order."""
+    unsupported = tmp_path / "notes.txt"
+    unsupported.write_text("not a resume", encoding="utf-8")
+    input_files = [
+        STRUCTURED_PATH / "_test_Res202511_Fry_MomCorp.yaml",
+        FIXTURES_PATH / "single_page_test.tex",
+        unsupported,
+        FIXTURES_PATH / "two_page_test.yaml",
+    ]
+
+    batch_dir = tmp_path / "batch"
+    results = list(validate_roundtrip_batch(input_files, batch_dir, 6, 0, workers=1))
+
+    assert [result["file"] for result in results] == [path.name for path in input_files]
+    for input_file, result in zip(input_files, results):
+        expected = validate_roundtrip_conversion(
+            input_file, tmp_path / "single" / input_file.stem, 6, 0
+        )
+        assert _without_timing(result) == _without_timing(expected)
+
+    # Each supported file is validated in its own work_dir/<stem> subdirectory
+    assert (batch_dir / "single_page_test").is_dir()
+    assert (batch_dir / "two_page_test").is_dir()
+    assert "Unsupported file type" in results[2]["error"]
+
+
+@pytest.mark.integration
+def test_yaml_to_latex_batch_sequential(tmp_path):
+    """Test that in-process batch generation matches yaml_to_latex, in input order."""
+    yaml_paths = [
+        STRUCTURED_PATH / "_test_Res202511_Fry_MomCorp_finetuned.yaml",
+        STRUCTURED_PATH / "_test_Res202511_Fry_MomCorp.yaml",
+    ]
+    output_path = tmp_path / "finetuned.tex"
+
+    latex_outputs = yaml_to_latex_batch(
+        [(yaml_paths[0], output_path), (yaml_paths[1], None)], workers=1
+    )
+
+    assert latex_outputs == [yaml_to_latex(path) for path in yaml_paths]
+    assert latex_outputs[0] != latex_outputs[1]
+    assert output_path.read_text(encoding="utf-8") == latex_outputs[0]
+    assert yaml_to_latex_batch([], workers=1) == []
+    # Sequential in-process conversion is the default
+    assert yaml_to_latex_batch([(yaml_paths[1], None)]) == latex_outputs[1:]
@@ -0,0 +1,60 @@
+"""
+Integration tests for roundtrip validation.
+Tests: fail_fast stops after the first failing roundtrip and marks the second as skipped.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+from archer.contexts.templating import converter
+from archer.utils.yaml_io import load_yaml, save_yaml
+
+load_dotenv()
+STRUCTURED_PATH = Path(os.getenv("RESUME_ARCHIVE_PATH")) / "structured"
+
+
+@pytest.fixture
+def drifting_reparse(monkeypatch):
+    """Make the LaTeX -> YAML step return the source YAML with one changed field."""
+    yaml_path = STRUCTURED_PATH / "_test_Res202511_Fry_MomCorp.yaml"
+
+    def reparse(latex_path, output_path=None):
+        data = load_yaml(yaml_path)
+        data["document"]["metadata"]["date"] = "January 3003"
+        save_yaml(data, output_path)
+        return data
+
+    monkeypatch.setattr(converter, "latex_to_yaml", reparse)
+    return yaml_path
+
+
+@pytest.mark.integration
+def test_fail_fast_skips_second_roundtrip(drifting_reparse, tmp_path):
+    """Test that fail_fast reports the unrun LaTeX roundtrip as skipped, not failed."""
+    result = converter.validate_roundtrip_conversion(
+        drifting_reparse, tmp_path, max_latex_diffs=6, max_yaml_diffs=0, fail_fast=True
+    )
+
+    assert result["error"] is None
+    assert result["validation_passed"] is False
+    assert result["yaml_roundtrip"]["success"] is False
+    assert result["yaml_roundtrip"]["num_diffs"] > 0
+    assert result["latex_roundtrip"] == {"success": None, "num_diffs": None, "skipped": True}
+    # Steps 5-7 never ran
+    assert not list(tmp_path.glob("*_regenerated*.tex"))
+
+
+@pytest.mark.integration
+def test_without_fail_fast_runs_both_roundtrips(drifting_reparse, tmp_path):
+    """Test that both roundtrips are measured when fail_fast is off."""
+    result = converter.validate_roundtrip_conversion(
+        drifting_reparse, tmp_path, max_latex_diffs=6, max_yaml_diffs=0
+    )
+
+    assert result["error"] is None
+    assert result["yaml_roundtrip"]["success"] is False
+    assert "skipped" not in result["latex_roundtrip"]
+    assert result["latex_roundtrip"]["num_diffs"] > 0
@@ -352,6 +352,16 @@ class TestParseItemizeContent:
         assert '40' in entries[0]['plaintext']
         assert '1M' in entries[0]['plaintext']
 
+    def test_matches_split_then_extract(self):
+        """Test single-pass parsing agrees with split_itemize_entries + extract_itemize_entry."""
+        content = '\\itemi First\n  \\itemi\n\n\\item[--] Second \\textbf{bold}\n\\itemLL   \n'
+        for pattern in (LaTeXPatterns.ITEM_ANY, LaTeXPatterns.ITEM_ALPHABETIC):
+            expected = [
+                extract_itemize_entry(entry, pattern)
+                for entry in split_itemize_entries(content, pattern)
+            ]
+            assert parse_itemize_content(content, pattern) == expected
+
 
 class TestExtractEnvironment:
     """Tests for extract_environment function."""
@@ -494,6 +504,15 @@ class TestExtractEnvironment:
         with pytest.raises(ValueError, match="Unmatched"):
             extract_environment(text, "itemize", num_params=1)
 
+    def test_unbalanced_mandatory_param_keeps_content(self):
+        """Test that an unclosed {param} stops extraction without swallowing the body."""
+        text = r'\begin{env}{First}{Unclosed \{param Content\end{env}'
+
+        params, content, _, _ = extract_environment(text, "env", num_params=2)
+
+        assert params == ['First']
+        assert content == r'{Unclosed \{param Content'
+
     def test_buggy_parameter_combination_error(self):
         """Test that NotImplementedError is raised for buggy parameter combination."""
         text = r'''\begin{itemizeAcademic}{Company}{Title}{Location}{Dates}
@@ -648,6 +667,18 @@ class TestExtractEnvironmentContent:
         assert text[:begin_pos] == r'\begin{itemize}'
         assert text[end_pos:] == r'\end{itemize}'
 
+    def test_include_env_command_positions(self):
+        """Test positions spanning the full environment including nested siblings."""
+        text = r'x \begin{itemize} a \begin{itemize} b \end{itemize} \begin{itemize} c \end{itemize} \end{itemize} y'
+        content, begin_pos, end_pos = extract_environment_content(
+            text, 'itemize', include_env_command_in_positions=True
+        )
+
+        assert begin_pos == 2
+        assert text[end_pos:] == ' y'
+        assert content.startswith(r'\begin{itemize} a ')
+        assert content.endswith(r'c \end{itemize} \end{itemize}')
+
     def test_environment_not_found(self):
         """Test ValueError when environment not found."""
         text = r'No environment here'
@@ -123,3 +123,41 @@ def test_custom_delimiters():
 
     # LaTeX braces should be preserved
     assert "\\textbf{Bold Text}" in result
+
+
+@pytest.mark.unit
+def test_default_registries_are_shared(tmp_path):
+    """Test that converters without explicit registries share the default instances."""
+    from archer.contexts.templating.latex_generator import YAMLToLaTeXConverter
+    from archer.contexts.templating.latex_parser import LaTeXToYAMLConverter
+    from archer.contexts.templating.registries import (
+        get_default_parse_config_registry,
+        get_default_template_registry,
+    )
+
+    assert get_default_template_registry() is get_default_template_registry()
+    assert get_default_parse_config_registry() is get_default_parse_config_registry()
+
+    # Converters also load the user profile; use a stub so the test needs no local config
+    profile_path = tmp_path / "user_profile.yaml"
+    profile_path.write_text("{}\n", encoding="utf-8")
+
+    parser = LaTeXToYAMLConverter(profile_path=profile_path)
+    generator = YAMLToLaTeXConverter(profile_path=profile_path)
+
+    assert parser.template_registry is get_default_template_registry()
+    assert generator.template_registry is parser.template_registry
+    assert generator.parse_config_registry is get_default_parse_config_registry()
+
+
+@pytest.mark.unit
+def test_parse_config_environment_name():
+    """Test environment name lookup from parse config is cached."""
+    from archer.contexts.templating.registries import ParseConfigRegistry
+
+    registry = ParseConfigRegistry()
+    env_name = registry.get_environment_name("work_experience")
+
+    assert env_name == "itemizeAcademic"
+    assert registry.get_environment_name("work_experience") is env_name
+    assert registry.is_cached("work_experience")
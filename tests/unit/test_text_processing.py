@@ -0,0 +1,97 @@
+"""
+Unit tests for text processing utilities.
+
+Tests helpers in archer.utils.text_processing.
+"""
+
+import re
+
+import pytest
+
+from archer.utils.text_processing import extract_balanced_delimiters, iter_split
+
+
+class TestExtractBalancedDelimiters:
+    """Tests for extract_balanced_delimiters function."""
+
+    def test_simple_braces(self):
+        """Test extracting content from a single brace group."""
+        text = "\\cmd{content} after"
+        content, end_pos = extract_balanced_delimiters(text, 5)
+
+        assert content == "content"
+        assert text[end_pos:] == " after"
+
+    def test_nested_braces(self):
+        """Test that nested braces are included in content."""
+        text = "{outer {inner {deep}} tail} rest"
+        content, end_pos = extract_balanced_delimiters(text, 1)
+
+        assert content == "outer {inner {deep}} tail"
+        assert text[end_pos:] == " rest"
+
+    def test_escaped_delimiters_ignored(self):
+        """Test that escaped braces do not change depth."""
+        text = r"{a \{ b \} c} rest"
+        content, end_pos = extract_balanced_delimiters(text, 1)
+
+        assert content == r"a \{ b \} c"
+        assert text[end_pos:] == " rest"
+
+    def test_escaped_backslash_before_brace(self):
+        """Test that a double backslash does not escape the following brace."""
+        text = r"{line\\}rest"
+        content, end_pos = extract_balanced_delimiters(text, 1)
+
+        assert content == r"line\\"
+        assert text[end_pos:] == "rest"
+
+    def test_square_brackets(self):
+        """Test custom delimiter characters."""
+        text = "[list [1, 2] more] end"
+        content, end_pos = extract_balanced_delimiters(text, 1, "[", "]")
+
+        assert content == "list [1, 2] more"
+        assert text[end_pos:] == " end"
+
+    def test_empty_content(self):
+        """Test an immediately closed delimiter."""
+        content, end_pos = extract_balanced_delimiters("{}x", 1)
+
+        assert content == ""
+        assert end_pos == 2
+
+    def test_unmatched_raises(self):
+        """Test that unmatched delimiters raise ValueError."""
+        with pytest.raises(ValueError, match="Unmatched"):
+            extract_balanced_delimiters("{never closed", 1)
+
+    def test_trailing_escape_raises(self):
+        """Test that a trailing escape character cannot close the group."""
+        with pytest.raises(ValueError, match="Unmatched"):
+            extract_balanced_delimiters("{abc\\", 1)
+
+
+class TestIterSplit:
+    """Tests for iter_split function."""
+
+    @pytest.mark.parametrize(
+        "text, pattern",
+        [
+            ("a, b,,c", r",\s*"),
+            ("", r",\s*"),
+            (",leading and trailing,", r","),
+            (r"\item[x] one \item[y] two", r"(?=\\item)"),
+            ("no separators here", r"\|"),
+        ],
+    )
+    def test_matches_re_split(self, text, pattern):
+        """Test pieces match re.split for patterns without capture groups."""
+        assert list(iter_split(text, pattern)) == re.split(pattern, text)
+
+    def test_is_lazy(self):
+        """Test pieces are produced one at a time."""
+        pieces = iter_split("a|b|c", r"\|")
+
+        assert next(pieces) == "a"
+        assert next(pieces) == "b"
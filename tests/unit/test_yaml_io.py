@@ -0,0 +1,49 @@
+"""Unit tests for YAML file I/O helpers."""
+
+import pytest
+import yaml
+from omegaconf import OmegaConf
+
+from archer.utils.yaml_io import YAMLSafeLoader, dump_yaml, load_yaml
+
+SCALARS_YAML = """\
+date: 2024-01-15
+timestamp: 2001-12-14t21:59:43.10-05:00
+time: 12:30:00
+exponent: 1e3
+negative_exponent: -1E-3
+underscored: 1_000.5
+plain_float: 1.5
+integer: 42
+flag: yes
+nothing: ~
+dates_in_list: [2024-01-15, 1e3, 2024-06-30]
+"""
+
+
+@pytest.mark.unit
+def test_load_yaml_resolves_scalars_like_omegaconf(tmp_path):
+    """Test that dates stay strings and exponent floats are floats, as with OmegaConf."""
+    yaml_path = tmp_path / "scalars.yaml"
+    yaml_path.write_text(SCALARS_YAML, encoding="utf-8")
+
+    loaded = load_yaml(yaml_path)
+    expected = OmegaConf.to_container(OmegaConf.load(yaml_path))
+
+    assert loaded == expected
+    assert {key: type(value) for key, value in loaded.items()} == {
+        key: type(value) for key, value in expected.items()
+    }
+    assert loaded["date"] == "2024-01-15"
+    assert loaded["exponent"] == 1000.0
+
+
+@pytest.mark.unit
+def test_dump_yaml_quotes_float_like_strings():
+    """Test that strings the loader would resolve as floats survive a dump/load roundtrip."""
+    data = {"exponent": "1e3", "date": "2024-01-15", "plain": "text"}
+
+    dumped = dump_yaml(data)
+
+    assert dumped == OmegaConf.to_yaml(OmegaConf.create(data))
+    assert yaml.load(dumped, Loader=YAMLSafeLoader) == data